@@ -261,18 +261,42 @@ class RollbackStore:
 
     def __init__(self):
         self.states = {}  # session_id -> list of states
+        self.meta = {}  # session_id -> data shared by all of its states
+
+    def save_session_meta(self, session_id: str, meta: Dict[str, Any]) -> None:
+        """
+        Start a session with data that stays the same for all its states.
+
+        The metadata (e.g. the original input) is saved as the session's
+        first state, and states saved after it reference it instead of
+        repeating it; the getters merge it back in. Earlier states under the
+        same id are kept.
+        """
+        self.meta[session_id] = meta
+        self.save_state(session_id, meta)
+
+    @staticmethod
+    def _resolve(entry: Dict[str, Any]) -> Dict[str, Any]:
+        meta = entry.get("meta")
+        return {**meta, **entry["state"]} if meta else entry["state"]
 
     def save_state(self, session_id: str, state: Dict[str, Any]) -> None:
         """Save a state for potential rollback."""
         if session_id not in self.states:
             self.states[session_id] = []
-        self.states[session_id].append({
+        entry = {
             "timestamp": datetime.now().isoformat(),
             "state": state,
-        })
+        }
+        meta = self.meta.get(session_id)
+        if meta is not None and meta is not state:
+            entry["meta"] = meta
+        self.states[session_id].append(entry)
 
     def get_original(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get the original state (first saved)."""
+        """Get the original state (session metadata, or the first saved state)."""
+        if session_id in self.meta:
+            return dict(self.meta[session_id])
         if session_id not in self.states or not self.states[session_id]:
             return None
         return self.states[session_id][0]["state"]
@@ -284,13 +308,13 @@ class RollbackStore:
         idx = len(self.states[session_id]) - 1 - steps_back
         if idx < 0:
             return None
-        return self.states[session_id][idx]["state"]
+        return self._resolve(self.states[session_id][idx])
 
     def get_latest(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get the latest state."""
         if session_id not in self.states or not self.states[session_id]:
             return None
-        return self.states[session_id][-1]["state"]
+        return self._resolve(self.states[session_id][-1])
 
     def list_states(self, session_id: str) -> List[Dict[str, Any]]:
         """List all states for a session."""
@@ -9,6 +9,7 @@ Validates implementation success and identifies issues.
 import sys
 import json
 import re
+import asyncio
 import time
 from pathlib import Path
 from datetime import datetime
@@ -411,6 +412,24 @@ def quick_review(
     )
 
 
+async def quick_review_async(
+    what_was_built: str,
+    criteria: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    quick_review() run in a worker thread, so several reviews can be
+    awaited together with asyncio.gather.
+
+    Args:
+        what_was_built: Summary of what was implemented
+        criteria: Optional list of criteria to check
+
+    Returns:
+        Review results
+    """
+    return await asyncio.to_thread(quick_review, what_was_built, criteria)
+
+
 # For standalone testing
 if __name__ == "__main__":
     import io
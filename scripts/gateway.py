@@ -11,6 +11,7 @@ Addresses Council Blocker: Unicode/encoding issues on Windows
 
 import sys
 import json
+import threading
 import requests
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -35,6 +36,18 @@ class CouncilGateway:
         self.gateway_url = GATEWAY_URL
         self.default_timeout = 120
         self.max_retries = 2
+        # One session per thread so repeated calls (review loops, refine
+        # rounds) reuse the pooled connection instead of reconnecting;
+        # requests.Session is not thread-safe, so worker threads get their own
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's HTTP session, created on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
 
     def call_model(
         self,
@@ -80,7 +93,7 @@ class CouncilGateway:
 
         for attempt in range(self.max_retries + 1):
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.gateway_url,
                     json=payload,
                     timeout=timeout,
@@ -5,6 +5,16 @@ models.py - Model configurations for Council system
 Addresses Council Blocker: Model selection, proper tier assignment
 """
 
+import re
+from types import MappingProxyType
+from typing import Optional
+
+# Optional: pyahocorasick scans every keyword table in a single pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Model configurations for each mode
 BRAINSTORMING_MODELS = {
     "models": [
@@ -134,15 +144,39 @@ MODEL_FALLBACKS = {
 }
 
 
+def _fallback_chain(model: str) -> tuple:
+    """Follow MODEL_FALLBACKS from a model, stopping before any repeat."""
+    chain = [model]
+    fallback = MODEL_FALLBACKS.get(model)
+    while fallback and fallback not in chain:
+        chain.append(fallback)
+        fallback = MODEL_FALLBACKS.get(fallback)
+    return tuple(chain)
+
+
+# Full ordered fallback chain per model (the model itself first), resolved
+# once at import. Cycles (e.g. claude-sonnet <-> opus-synthesis) are cut.
+MODEL_FALLBACK_CHAINS = {model: _fallback_chain(model) for model in MODEL_FALLBACKS}
+
+
 # ============================================================================
 # TIER CONFIGURATION (Council v2.0 Diamond Architecture)
 # ============================================================================
 
-TIER_CONFIG = {
+def _freeze(value):
+    """Recursively wrap dicts in read-only MappingProxyType views."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+# Tier configuration is read-only: consumers share one instance, so nothing
+# can mutate it behind another module's back
+TIER_CONFIG = _freeze({
     "tier_1": {
         "name": "Simple Query",
         "description": "Fast, single-model responses for straightforward questions",
-        "models": ["claude-sonnet"],
+        "models": ("claude-sonnet",),
         "triggers": {
             "no_arch_keywords": True,  # No architecture/strategy keywords
             "max_tokens": 500,          # Less than 500 tokens
@@ -154,7 +188,7 @@ TIER_CONFIG = {
     "tier_2": {
         "name": "Research Query",
         "description": "Web research + synthesis for external documentation",
-        "models": ["perplexity-researcher", "claude-sonnet"],
+        "models": ("perplexity-researcher", "claude-sonnet"),
         "triggers": {
             "has_docs_lookup": True,     # Requires external docs
             "has_research_tag": True,      # @research tag
@@ -166,7 +200,7 @@ TIER_CONFIG = {
     "tier_3": {
         "name": "Full Council (Diamond Architecture)",
         "description": "Complete parallel deliberation for architectural decisions",
-        "models": [
+        "models": (
             # Stage 1: Context Acquisition (Parallel)
             "kimi-researcher", "perplexity-online",
             # Stage 2: Deliberation (Parallel)
@@ -175,7 +209,7 @@ TIER_CONFIG = {
             "gemini-pro",
             # Stage 4: Ratification (conditional)
             "opus-synthesis",
-        ],
+        ),
         "triggers": {
             "has_council_v2_tag": True,     # @council_v2 explicit tag
             "is_architectural": True,       # Auto-classified as architectural
@@ -187,7 +221,7 @@ TIER_CONFIG = {
     "tier_3_lite": {
         "name": "Diamond Lite",
         "description": "Reduced parallel deliberation for medium complexity",
-        "models": ["kimi-researcher", "deepseek-v3", "claude-sonnet", "gemini-pro"],
+        "models": ("kimi-researcher", "deepseek-v3", "claude-sonnet", "gemini-pro"),
         "triggers": {
             "has_council_lite_tag": True,    # @council_lite tag
             "medium_complexity": True,       # Medium complexity
@@ -195,40 +229,194 @@ TIER_CONFIG = {
         "estimated_cost": (0.05, 0.15),     # $0.05 - $0.15
         "estimated_latency": 25,          # ~25 seconds
     },
-}
+})
 
 
 # Keywords that trigger higher-tier processing
-ARCHITECTURAL_KEYWORDS = [
-    "architecture", "design", "refactor", "restructure",
+# (keyword tables are tuples: they are only scanned, never mutated)
+ARCHITECTURAL_KEYWORDS = (
+    "architecture", "design", "redesign", "refactor", "restructure",
     "system", "module", "component", "integration", "api design", "database design",
     "schema", "workflow", "pipeline", "strategy", "pattern",
     # Comparison keywords (choosing between options)
     " vs ", " versus ", " or ", " compare ", " which ", " should we use ",
     "microservices", "monolith", "postgresql", "mongodb", "mysql",
-]
+)
 
 # Simple implementation keywords (Tier 1 - these take precedence)
-SIMPLE_IMPLEMENTATION_KEYWORDS = [
+SIMPLE_IMPLEMENTATION_KEYWORDS = (
     "implement a", "implement the", "create a", "create the",
     "write a", "write the", "add a", "add the",
     "fix this", "debug", "syntax error", "indentation",
-]
+)
 
-EXTERNAL_DOCS_KEYWORDS = [
+EXTERNAL_DOCS_KEYWORDS = (
     "pricing", "latest version", "current docs", "documentation",
     "api reference", "changelog", "release notes", "official docs",
-]
+)
+
+
+# Word tokens of a lowercased query; single-word keywords must equal a token
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _is_word(keyword: str) -> bool:
+    """True for single-word keywords, which match the start of a token."""
+    return _TOKEN_RE.fullmatch(keyword) is not None
+
+
+def _compile_keywords(keywords) -> "re.Pattern":
+    """
+    Compile a phrase list into one alternation (plain substring semantics).
+
+    Longer phrases come first, so at any position the most specific phrase
+    ("api design") is the one the alternation reports, not a shorter prefix.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(kw) for kw in ordered))
+
+
+class KeywordIndex:
+    """
+    Multi-pattern matcher over labelled keyword tables.
+
+    Single-word keywords ("design", "debug") match at the start of a word,
+    via one tokenization of the query and dict lookups of each token's
+    prefixes, so inflections ("debugging", "systems") still hit while a
+    keyword inside a word ("pattern" in "antipattern") does not. Phrases and
+    keywords with punctuation or padding ("api design", " or ", "long-term")
+    keep plain substring semantics: they are scanned with one Aho-Corasick
+    automaton over every table when pyahocorasick is installed, or one
+    precompiled regex alternation per label otherwise.
+    Matching is case-insensitive (callers pass lowercased text).
+    """
+
+    def __init__(self, tables: dict):
+        """
+        Args:
+            tables: Mapping of label -> keywords, in priority order
+                (earlier labels win in first(); keyword order within a
+                table does not matter)
+        """
+        self.labels = tuple(tables)
+        self._words = {}
+        self._word_lengths = ()
+        self._automaton = None
+        self._regexes = ()
+
+        phrases = {}
+        for priority, (label, keywords) in enumerate(tables.items()):
+            phrases[label] = []
+            for kw in keywords:
+                kw = kw.lower()
+                if _is_word(kw):
+                    # A keyword may appear in several tables: store every priority
+                    priorities = self._words.get(kw, ())
+                    if priority not in priorities:
+                        self._words[kw] = priorities + (priority,)
+                elif kw not in phrases[label]:
+                    phrases[label].append(kw)
+        self._word_lengths = tuple(sorted({len(kw) for kw in self._words}))
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for priority, keywords in enumerate(phrases.values()):
+                for kw in keywords:
+                    priorities = automaton.get(kw, ())
+                    automaton.add_word(kw, priorities + (priority,))
+            if len(automaton):
+                automaton.make_automaton()
+                self._automaton = automaton
+        else:
+            self._regexes = tuple(
+                (priority, _compile_keywords(keywords))
+                for priority, keywords in enumerate(phrases.values()) if keywords
+            )
+
+    def _priorities(self, text_lower: str):
+        """Yield the priority tuple of every keyword hit in the text."""
+        words = self._words
+        for token in set(_TOKEN_RE.findall(text_lower)):
+            for length in self._word_lengths:
+                if length > len(token):
+                    break
+                priorities = words.get(token[:length])
+                if priorities is not None:
+                    yield priorities
+        if self._automaton is not None:
+            for _, priorities in self._automaton.iter(text_lower):
+                yield priorities
+        else:
+            for priority, regex in self._regexes:
+                if regex.search(text_lower):
+                    yield (priority,)
+
+    def search(self, text_lower: str) -> set:
+        """
+        Find every label with at least one keyword in the text.
+
+        Args:
+            text_lower: Lowercased text to scan
+
+        Returns:
+            Set of matching labels
+        """
+        labels = self.labels
+        return {labels[p] for priorities in self._priorities(text_lower) for p in priorities}
+
+    def first(self, text_lower: str) -> Optional[str]:
+        """
+        Find the highest-priority label with a keyword in the text.
+
+        Args:
+            text_lower: Lowercased text to scan
+
+        Returns:
+            Matching label with the highest priority, or None
+        """
+        best = None
+        for priorities in self._priorities(text_lower):
+            p = min(priorities)
+            if best is None or p < best:
+                best = p
+                if best == 0:
+                    break
+        return None if best is None else self.labels[best]
+
+
+# Tier routing tables as "SOURCE:tier" labels, in precedence order: explicit
+# routing tags first, then keywords (simple implementation, docs,
+# architecture). One index over all of them replaces the per-table tests,
+# and other classifiers can fold these tables into their own index.
+TIER_TABLES = {
+    "TAG:tier_3": ("@council_v2",),
+    "TAG:tier_3_lite": ("@council_lite",),
+    "TAG:tier_2": ("@research",),
+    "KEYWORD:tier_1": SIMPLE_IMPLEMENTATION_KEYWORDS,
+    "KEYWORD:tier_2": EXTERNAL_DOCS_KEYWORDS,
+    "KEYWORD:tier_3": ARCHITECTURAL_KEYWORDS,
+}
+
+# Tier label -> tier name
+TIER_OF_LABEL = {label: label.split(":", 1)[1] for label in TIER_TABLES}
+
+_TIER_INDEX = KeywordIndex(TIER_TABLES)
+_first_tier_match = _TIER_INDEX.first
 
 # Opus mandatory categories (per Council ruling)
-OPUS_MANDATORY_CATEGORIES = [
+OPUS_MANDATORY_CATEGORIES = (
     "strategy", "architecture", "client_communication", "executive",
-]
+)
 
 # Opus skip categories (per Council ruling)
-OPUS_SKIP_CATEGORIES = [
+OPUS_SKIP_CATEGORIES = (
     "code_implementation", "simple_debugging", "syntax_error",
-]
+)
+
+_OPUS_CATEGORY_INDEX = KeywordIndex({
+    "MANDATORY": OPUS_MANDATORY_CATEGORIES,
+    "SKIP": OPUS_SKIP_CATEGORIES,
+})
 
 
 def classify_query_tier(query: str, token_count: int = 0, metadata: dict = None) -> str:
@@ -243,38 +431,19 @@ def classify_query_tier(query: str, token_count: int = 0, metadata: dict = None)
     Returns:
         Tier name: "tier_1", "tier_2", "tier_3", or "tier_3_lite"
     """
-    metadata = metadata or {}
-    query_lower = query.lower()
+    return classify_lowered_tier(query.lower(), token_count, metadata)
 
-    # Check for explicit tags (highest priority)
-    if "@council_v2" in query_lower:
-        return "tier_3"
-    if "@council_lite" in query_lower:
-        return "tier_3_lite"
-    if "@research" in query_lower:
-        return "tier_2"
 
-    # Check for simple implementation keywords (Tier 1 - takes precedence)
-    has_simple_impl = any(kw in query_lower for kw in SIMPLE_IMPLEMENTATION_KEYWORDS)
-
-    # Check for architectural keywords
-    has_arch_keywords = any(kw in query_lower for kw in ARCHITECTURAL_KEYWORDS)
-
-    # Check for external docs keywords
-    has_docs_keywords = any(kw in query_lower for kw in EXTERNAL_DOCS_KEYWORDS)
-
-    # Apply tier logic (simple implementation first, then docs, then architecture)
-    if has_simple_impl:
-        return "tier_1"
-
-    if has_docs_keywords:
-        return "tier_2"
-
-    if has_arch_keywords:
-        return "tier_3"
+def classify_lowered_tier(query_lower: str, token_count: int = 0, metadata: dict = None) -> str:
+    """
+    Same as classify_query_tier, for a query that is already lowercased.
 
-    # Default: Tier 1 for simple queries
-    return "tier_1"
+    Lets callers that lowercase the query for other checks reuse it.
+    """
+    # Tags, then simple implementation, docs, architecture, in one scan;
+    # default: Tier 1 for simple queries
+    label = _first_tier_match(query_lower)
+    return TIER_OF_LABEL[label] if label is not None else "tier_1"
 
 
 def should_invoke_opus(query: str, tier: str, current_monthly_spend: float = 0) -> bool:
@@ -289,19 +458,17 @@ def should_invoke_opus(query: str, tier: str, current_monthly_spend: float = 0)
     Returns:
         True if Opus should be invoked, False otherwise
     """
-    query_lower = query.lower()
+    categories = _OPUS_CATEGORY_INDEX.search(query.lower())
 
     # Check budget gate (40% of total budget)
     if current_monthly_spend > 100.0:  # Assuming $100 monthly budget example
         # Skip non-mandatory Opus invocations
-        for category in OPUS_SKIP_CATEGORIES:
-            if category in query_lower:
-                return False
+        if "SKIP" in categories:
+            return False
 
     # Check mandatory categories
-    for category in OPUS_MANDATORY_CATEGORIES:
-        if category in query_lower:
-            return True
+    if "MANDATORY" in categories:
+        return True
 
     # Tier 3 queries get Opus by default
     if tier == "tier_3":
@@ -311,15 +478,15 @@ def should_invoke_opus(query: str, tier: str, current_monthly_spend: float = 0)
     return False
 
 
-def get_models_for_tier(tier: str) -> list:
+def get_models_for_tier(tier: str) -> tuple:
     """
-    Get the list of models for a given tier.
+    Get the models for a given tier.
 
     Args:
         tier: Tier name ("tier_1", "tier_2", "tier_3", "tier_3_lite")
 
     Returns:
-        List of model names for this tier
+        Tuple of model names for this tier
     """
     if tier not in TIER_CONFIG:
         raise ValueError(f"Unknown tier: {tier}")
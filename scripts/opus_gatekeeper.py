@@ -12,42 +12,41 @@ Per Council Ruling (2026-01-30):
 - Tier-Based: Tier 3 gets Opus by default
 """
 
-import os
 import sys
 import re
+import asyncio
+import hashlib
+import json
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
-from enum import Enum
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
-try:
-    from skills.council.scripts.models import (
-        classify_query_tier,
-        OPUS_MANDATORY_CATEGORIES,
-        OPUS_SKIP_CATEGORIES,
-        TIER_CONFIG,
-    )
-except ImportError:
-    # Fallback definitions
-    OPUS_MANDATORY_CATEGORIES = ["strategy", "architecture", "client_communication", "executive"]
-    OPUS_SKIP_CATEGORIES = ["code_implementation", "simple_debugging", "syntax_error"]
-
-    def classify_query_tier(query: str, token_count: int = 0, metadata: dict = None) -> str:
-        return "tier_1"
-
-    TIER_CONFIG = {}
-
-
-class OpusDecision(Enum):
-    """Opus invocation decision."""
-    INVOKE = "INVOKE"  # Invoke Opus (mandatory or recommended)
-    SKIP = "SKIP"  # Skip Opus (not needed)
-    BUDGET_BLOCK = "BUDGET_BLOCK"  # Skip due to budget constraints
-
-
-@dataclass
+from enum import IntEnum
+from functools import lru_cache
+from pathlib import Path
+
+# Bootstrap: Add scripts directory to path for direct script execution
+scripts_dir = Path(__file__).resolve().parent
+if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
+
+# Use absolute imports (relative imports don't work when script run directly)
+from models import (
+    KeywordIndex,
+    OPUS_MANDATORY_CATEGORIES,
+    OPUS_SKIP_CATEGORIES,
+    TIER_CONFIG,
+    TIER_OF_LABEL,
+    TIER_TABLES,
+)
+
+
+class OpusDecision(IntEnum):
+    """Opus invocation decision (integer-valued; use .name for display)."""
+    INVOKE = 0  # Invoke Opus (mandatory or recommended)
+    SKIP = 1  # Skip Opus (not needed)
+    BUDGET_BLOCK = 2  # Skip due to budget constraints
+
+
+@dataclass(slots=True, frozen=True)
 class GatekeeperResult:
     """Result from Opus gatekeeper analysis."""
     decision: OpusDecision
@@ -58,6 +57,71 @@ class GatekeeperResult:
     budget_remaining: float
     budget_threshold: float
 
+    def to_json(self) -> str:
+        """Serialize as one line of JSON (decision by name)."""
+        return json.dumps({
+            "decision": self.decision.name,
+            "reason": self.reason,
+            "confidence": self.confidence,
+            "category": self.category,
+            "tier": self.tier,
+            "budget_remaining": self.budget_remaining,
+            "budget_threshold": self.budget_threshold,
+        }, ensure_ascii=False)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_query(query: str) -> str:
+    """Cache key for a query: lowercased with whitespace collapsed."""
+    return _WHITESPACE_RE.sub(" ", query.lower()).strip()
+
+
+@lru_cache(maxsize=4096)
+def _classify_cached(
+    gatekeeper_cls: type,
+    query_key: str,
+    tier: Optional[str]
+) -> Tuple[str, str, float]:
+    """
+    Budget-independent part of the gatekeeper decision, memoized per process.
+
+    Args:
+        gatekeeper_cls: Gatekeeper class whose keyword tables apply
+        query_key: Normalized query (see _normalize_query)
+        tier: Pre-classified tier, or None to classify
+
+    Returns:
+        Tuple of (tier, category, confidence)
+    """
+    return gatekeeper_cls._classify_lowered(query_key, tier)
+
+
+def _build_category_indexes(mandatory_keywords: dict, skip_keywords: dict) -> tuple:
+    """
+    Build the gatekeeper's keyword indexes from its category tables.
+
+    Args:
+        mandatory_keywords: MANDATORY category -> keywords
+        skip_keywords: SKIP category -> keywords
+
+    Returns:
+        Tuple of (category index, label -> (kind, name), fused tier+category index)
+    """
+    # All category tables in one index, in priority order (MANDATORY before SKIP)
+    tables = {
+        **{f"MANDATORY:{category}": keywords for category, keywords in mandatory_keywords.items()},
+        **{f"SKIP:{category}": keywords for category, keywords in skip_keywords.items()},
+    }
+
+    # Category label -> (kind, name), so decisions need no string parsing
+    kinds = {label: tuple(label.split(":", 1)) for label in tables}
+
+    # Tier and category tables fused into one index, so a query without a
+    # pre-classified tier is still scanned only once
+    return KeywordIndex(tables), kinds, KeywordIndex({**TIER_TABLES, **tables})
+
 
 class OpusGatekeeper:
     """
@@ -73,48 +137,66 @@ class OpusGatekeeper:
     # Minimum budget for Opus invocation
     MIN_OPUS_BUDGET = 0.50  # $0.50 minimum remaining
 
+    # Async callers classify queries longer than this in a worker thread
+    ASYNC_OFFLOAD_CHARS = 1024
+
     # Keywords for category detection
     MANDATORY_KEYWORDS = {
-        "strategy": [
+        "strategy": (
             "strategy", "strategic", "roadmap", "vision", "long-term",
             "architecture decision", "system design", "tech stack choice",
             "should we", "which approach", "evaluate options", "compare",
-        ],
-        "architecture": [
-            "architecture", "design", "refactor", "restructure", "pattern",
+        ),
+        "architecture": (
+            "architecture", "design", "redesign", "refactor", "restructure", "pattern",
             "system", "module", "component", "integration", "api design",
             "database design", "schema", "workflow", "pipeline",
-        ],
-        "client_communication": [
+        ),
+        "client_communication": (
             "client", "customer", "stakeholder", "presentation", "proposal",
             "explain to", "communicate", "report", "executive summary",
-        ],
-        "executive": [
+        ),
+        "executive": (
             "executive", "leadership", "decision", "approve", "authorize",
             "budget", "timeline", "resource allocation", "priority",
-        ],
+        ),
     }
 
     SKIP_KEYWORDS = {
-        "code_implementation": [
+        "code_implementation": (
             "implement this", "write code", "create function", "add method",
             "implement", "build this", "code this",
-        ],
-        "simple_debugging": [
+        ),
+        "simple_debugging": (
             "fix this bug", "debug", "error in", "not working",
             "throws error", "fails", "broken",
-        ],
-        "syntax_error": [
+        ),
+        "syntax_error": (
             "syntax error", "parse error", "indentation", "missing",
             "unexpected token", "invalid syntax",
-        ],
+        ),
     }
 
+    # Indexes over the keyword tables, rebuilt for subclasses that
+    # override them (see __init_subclass__)
+    _CATEGORY_INDEX, _CATEGORY_KINDS, _FUSED_INDEX = _build_category_indexes(
+        MANDATORY_KEYWORDS, SKIP_KEYWORDS
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """Rebuild the indexes when a subclass overrides a keyword table."""
+        super().__init_subclass__(**kwargs)
+        if "MANDATORY_KEYWORDS" in cls.__dict__ or "SKIP_KEYWORDS" in cls.__dict__:
+            indexes = _build_category_indexes(cls.MANDATORY_KEYWORDS, cls.SKIP_KEYWORDS)
+            cls._CATEGORY_INDEX, cls._CATEGORY_KINDS, cls._FUSED_INDEX = indexes
+
     def __init__(
         self,
         monthly_budget: float = 100.0,
         current_monthly_spend: float = 0.0,
-        budget_threshold: float = BUDGET_GATE_THRESHOLD
+        budget_threshold: float = BUDGET_GATE_THRESHOLD,
+        cache_backend=None,
+        ttl: int = 3600
     ):
         """
         Initialize the Opus gatekeeper.
@@ -123,39 +205,64 @@ class OpusGatekeeper:
             monthly_budget: Total monthly budget (default: $100)
             current_monthly_spend: Amount already spent this month
             budget_threshold: Budget gate threshold (default: 40%)
+            cache_backend: Optional shared cache with get/setex, e.g. redis.Redis,
+                so worker processes share classification results
+            ttl: Seconds a shared cache entry lives (default: 1 hour)
         """
         self.monthly_budget = monthly_budget
         self.current_monthly_spend = current_monthly_spend
         self.budget_threshold = budget_threshold
+        self.cache_backend = cache_backend
+        self.ttl = ttl
 
         # Calculate budget gate
         self.budget_gate = monthly_budget * budget_threshold
 
-    def _classify_category(self, query: str) -> Tuple[str, float]:
+    @classmethod
+    def _classify_category(cls, query_lower: str) -> Tuple[str, float]:
         """
         Classify query into MANDATORY, SKIP, or NONE category.
 
         Args:
-            query: The user's query
+            query_lower: The user's query, already lowercased
 
         Returns:
             Tuple of (category, confidence)
         """
-        query_lower = query.lower()
+        # One scan for every category; MANDATORY labels outrank SKIP labels
+        category = cls._CATEGORY_INDEX.first(query_lower)
+        if category is not None:
+            return category, 0.9
+
+        return "NONE", 0.5
+
+    @classmethod
+    def _classify_lowered(
+        cls,
+        query_lower: str,
+        tier: Optional[str]
+    ) -> Tuple[str, str, float]:
+        """
+        Classify tier (if not provided) and category in a single scan.
 
-        # Check MANDATORY categories
-        for category, keywords in self.MANDATORY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in query_lower:
-                    return f"MANDATORY:{category}", 0.9
+        Args:
+            query_lower: The user's query, already lowercased
+            tier: Pre-classified tier, or None to classify
 
-        # Check SKIP categories
-        for category, keywords in self.SKIP_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in query_lower:
-                    return f"SKIP:{category}", 0.9
+        Returns:
+            Tuple of (tier, category, confidence)
+        """
+        if tier is not None:
+            return (tier, *cls._classify_category(query_lower))
 
-        return "NONE", 0.5
+        hits = cls._FUSED_INDEX.search(query_lower)
+        tier = next(
+            (TIER_OF_LABEL[label] for label in TIER_TABLES if label in hits), "tier_1"
+        )
+        for label in cls._CATEGORY_INDEX.labels:
+            if label in hits:
+                return tier, label, 0.9
+        return tier, "NONE", 0.5
 
     def _check_budget(self) -> Tuple[bool, float]:
         """
@@ -201,100 +308,253 @@ class OpusGatekeeper:
         Returns:
             GatekeeperResult with decision and rationale
         """
-        # Classify tier if not provided
-        if tier is None:
-            tier = classify_query_tier(query, token_count, metadata)
+        tier, category, confidence = self._classify(query, tier)
+        can_invoke_budget, remaining = self._check_budget()
+        return self._decide(tier, category, confidence, can_invoke_budget, remaining)
+
+    def classify_batch(
+        self,
+        queries: List[str],
+        tiers: Optional[List[str]] = None
+    ) -> List[GatekeeperResult]:
+        """
+        Determine Opus invocation for many queries at once.
+
+        Checks the budget once for the whole batch and classifies each
+        distinct query once, so repeated sub-prompts in a workflow are free.
+
+        Args:
+            queries: Queries to classify
+            tiers: Optional pre-classified tier per query
 
-        # Classify category
-        category, confidence = self._classify_category(query)
+        Returns:
+            GatekeeperResults in the same order as queries
 
-        # Check budget
+        Raises:
+            ValueError: If tiers and queries differ in length
+        """
+        tiers = tiers or [None] * len(queries)
         can_invoke_budget, remaining = self._check_budget()
+        return [
+            self._decide(
+                *self._classify(query, tier), can_invoke_budget, remaining
+            )
+            for query, tier in zip(queries, tiers, strict=True)
+        ]
+
+    def _classify(self, query: str, tier: Optional[str]) -> Tuple[str, str, float]:
+        """
+        Classify tier (if not provided) and category.
+
+        Token count and metadata do not affect classification, so every
+        query goes through the same normalized cache key.
+
+        Returns:
+            Tuple of (tier, category, confidence)
+        """
+        query_key = _normalize_query(query)
+        if self.cache_backend is None:
+            return _classify_cached(type(self), query_key, tier)
+        return self._classify_shared(query_key, tier)
+
+    def _classify_shared(
+        self,
+        query_key: str,
+        tier: Optional[str]
+    ) -> Tuple[str, str, float]:
+        """
+        Classify through the shared cache backend.
+
+        Only the budget-independent classification is shared; each process
+        still applies its own budget state in _decide. Backend failures fall
+        back to local classification.
+
+        Returns:
+            Tuple of (tier, category, confidence)
+        """
+        key = "opus_gatekeeper:{}:{}".format(
+            hashlib.sha256(query_key.encode()).hexdigest()[:16], tier or "auto"
+        )
+        try:
+            cached = self.cache_backend.get(key)
+        except Exception:
+            cached = None
+        if cached:
+            return tuple(json.loads(cached))
+
+        classified = _classify_cached(type(self), query_key, tier)
+        try:
+            self.cache_backend.setex(key, self.ttl, json.dumps(classified))
+        except Exception:
+            pass
+        return classified
+
+    def _decide(
+        self,
+        tier: str,
+        category: str,
+        confidence: float,
+        can_invoke_budget: bool,
+        remaining: float
+    ) -> GatekeeperResult:
+        """
+        Apply the Council decision rules to a classified query.
+
+        Args:
+            tier: Tier classification
+            category: Category from _classify_category
+            confidence: Category confidence
+            can_invoke_budget: Whether remaining budget allows Opus
+            remaining: Remaining monthly budget
+
+        Returns:
+            GatekeeperResult with decision and rationale
+        """
+        kind, name = self._CATEGORY_KINDS.get(category, ("NONE", None))
 
         # Decision logic (per Council ruling)
 
         # 1. MANDATORY categories always invoke Opus (if budget allows)
-        if category.startswith("MANDATORY:"):
+        if kind == "MANDATORY":
             if can_invoke_budget:
-                return GatekeeperResult(
-                    decision=OpusDecision.INVOKE,
-                    reason=f"MANDATORY category ({category.split(':', 1)[1]}) per Council ruling",
-                    confidence=confidence,
-                    category=category,
-                    tier=tier,
-                    budget_remaining=remaining,
-                    budget_threshold=self.budget_gate,
+                return self._make(
+                    OpusDecision.INVOKE,
+                    f"MANDATORY category ({name}) per Council ruling",
+                    confidence,
+                    category,
+                    tier,
+                    remaining,
                 )
             else:
-                return GatekeeperResult(
-                    decision=OpusDecision.BUDGET_BLOCK,
-                    reason=f"MANDATORY category but budget insufficient (${remaining:.2f} < ${self.MIN_OPUS_BUDGET})",
-                    confidence=1.0,
-                    category=category,
-                    tier=tier,
-                    budget_remaining=remaining,
-                    budget_threshold=self.budget_gate,
+                return self._make(
+                    OpusDecision.BUDGET_BLOCK,
+                    f"MANDATORY category but budget insufficient (${remaining:.2f} < ${self.MIN_OPUS_BUDGET})",
+                    1.0,
+                    category,
+                    tier,
+                    remaining,
                 )
 
         # 2. SKIP categories never invoke Opus
-        if category.startswith("SKIP:"):
-            return GatekeeperResult(
-                decision=OpusDecision.SKIP,
-                reason=f"SKIP category ({category.split(':', 1)[1]}) per Council ruling",
-                confidence=confidence,
-                category=category,
-                tier=tier,
-                budget_remaining=remaining,
-                budget_threshold=self.budget_gate,
+        if kind == "SKIP":
+            return self._make(
+                OpusDecision.SKIP,
+                f"SKIP category ({name}) per Council ruling",
+                confidence,
+                category,
+                tier,
+                remaining,
             )
 
         # 3. Budget gate check (40% threshold)
         if self.current_monthly_spend > self.budget_gate:
             # Above budget gate, skip non-mandatory Opus
-            return GatekeeperResult(
-                decision=OpusDecision.BUDGET_BLOCK,
-                reason=f"Budget gate exceeded (${self.current_monthly_spend:.2f} > ${self.budget_gate:.2f})",
-                confidence=0.8,
-                category=category,
-                tier=tier,
-                budget_remaining=remaining,
-                budget_threshold=self.budget_gate,
+            return self._make(
+                OpusDecision.BUDGET_BLOCK,
+                f"Budget gate exceeded (${self.current_monthly_spend:.2f} > ${self.budget_gate:.2f})",
+                0.8,
+                category,
+                tier,
+                remaining,
             )
 
         # 4. Tier-based eligibility
         if self._check_tier_eligibility(tier):
             if can_invoke_budget:
-                return GatekeeperResult(
-                    decision=OpusDecision.INVOKE,
-                    reason=f"Tier {tier} invokes Opus by default",
-                    confidence=0.7,
-                    category=category,
-                    tier=tier,
-                    budget_remaining=remaining,
-                    budget_threshold=self.budget_gate,
+                return self._make(
+                    OpusDecision.INVOKE,
+                    f"Tier {tier} invokes Opus by default",
+                    0.7,
+                    category,
+                    tier,
+                    remaining,
                 )
             else:
-                return GatekeeperResult(
-                    decision=OpusDecision.BUDGET_BLOCK,
-                    reason=f"Tier {tier} eligible but budget insufficient",
-                    confidence=0.7,
-                    category=category,
-                    tier=tier,
-                    budget_remaining=remaining,
-                    budget_threshold=self.budget_gate,
+                return self._make(
+                    OpusDecision.BUDGET_BLOCK,
+                    f"Tier {tier} eligible but budget insufficient",
+                    0.7,
+                    category,
+                    tier,
+                    remaining,
                 )
 
         # 5. Default: Skip Opus for simple queries
+        return self._make(
+            OpusDecision.SKIP,
+            f"No mandatory category detected, Tier {tier} does not require Opus",
+            0.6,
+            category,
+            tier,
+            remaining,
+        )
+
+    def _make(
+        self,
+        decision: OpusDecision,
+        reason: str,
+        confidence: float,
+        category: str,
+        tier: str,
+        remaining: float
+    ) -> GatekeeperResult:
+        """Build a GatekeeperResult carrying this gatekeeper's budget gate."""
         return GatekeeperResult(
-            decision=OpusDecision.SKIP,
-            reason=f"No mandatory category detected, Tier {tier} does not require Opus",
-            confidence=0.6,
-            category=category,
-            tier=tier,
-            budget_remaining=remaining,
-            budget_threshold=self.budget_gate,
+            decision, reason, confidence, category, tier, remaining, self.budget_gate
         )
 
+    async def aclassify(
+        self,
+        query: str,
+        tier: str = None,
+        token_count: int = 0,
+        metadata: dict = None
+    ) -> GatekeeperResult:
+        """
+        Async variant of should_invoke_opus for event-loop callers.
+
+        Long queries are classified in a worker thread so the event loop
+        is not blocked; short ones are classified inline.
+
+        Args:
+            query: The user's query
+            tier: Pre-classified tier (will classify if not provided)
+            token_count: Estimated token count
+            metadata: Additional metadata
+
+        Returns:
+            GatekeeperResult with decision and rationale
+        """
+        if len(query) > self.ASYNC_OFFLOAD_CHARS:
+            return await asyncio.to_thread(
+                self.should_invoke_opus, query, tier, token_count, metadata
+            )
+        return self.should_invoke_opus(query, tier, token_count, metadata)
+
+    async def aclassify_many(
+        self,
+        queries: List[str],
+        tiers: Optional[List[str]] = None
+    ) -> List[GatekeeperResult]:
+        """
+        Classify a batch of queries concurrently.
+
+        Args:
+            queries: Queries to classify
+            tiers: Optional pre-classified tier per query
+
+        Returns:
+            GatekeeperResults in the same order as queries
+
+        Raises:
+            ValueError: If tiers and queries differ in length
+        """
+        # Pair up before creating coroutines, so a mismatch leaks none
+        pairs = list(zip(queries, tiers or [None] * len(queries), strict=True))
+        return list(await asyncio.gather(
+            *(self.aclassify(query, tier=tier) for query, tier in pairs)
+        ))
+
     def recommend_degradation(self, result: GatekeeperResult) -> Optional[str]:
         """
         Recommend alternative if Opus cannot be invoked.
@@ -323,11 +583,13 @@ class OpusGatekeeper:
 # CLI Testing
 # ============================================================================
 if __name__ == "__main__":
-    import json
+    # --json: one JSON object per line, for piping into other tools
+    as_json = "--json" in sys.argv[1:]
 
     gatekeeper = OpusGatekeeper(monthly_budget=100.0, current_monthly_spend=30.0)
 
-    print("=== Opus Gatekeeper Test ===\n")
+    if not as_json:
+        print("=== Opus Gatekeeper Test ===\n")
 
     test_queries = [
         ("design a new auth system architecture", "tier_3"),
@@ -338,12 +600,23 @@ if __name__ == "__main__":
         ("should we use PostgreSQL or MongoDB", "tier_3"),
     ]
 
-    for query, expected_tier in test_queries:
-        result = gatekeeper.should_invoke_opus(query, tier=expected_tier)
+    async def classify_all():
+        # Any failing coroutine surfaces here via gather
+        return await asyncio.gather(*(
+            gatekeeper.aclassify(query, tier=expected_tier)
+            for query, expected_tier in test_queries
+        ))
+
+    results = asyncio.run(classify_all())
+
+    if as_json:
+        sys.stdout.write("".join(result.to_json() + "\n" for result in results))
+        sys.exit(0)
 
+    for (query, _), result in zip(test_queries, results):
         print(f"Query: {query}")
         print(f"  Tier: {result.tier}")
-        print(f"  Decision: {result.decision.value}")
+        print(f"  Decision: {result.decision.name}")
         print(f"  Category: {result.category}")
         print(f"  Reason: {result.reason}")
         print(f"  Confidence: {result.confidence:.2f}")
@@ -13,14 +13,21 @@ Execution Pattern:
 """
 
 import os
+import re
 import sys
 import asyncio
+import hashlib
+import io
+import json
+import logging
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from contextvars import ContextVar
 from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -28,12 +35,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 # Import gateway for model calls
 try:
     from skills.council.scripts.gateway import get_gateway
-    from skills.council.scripts.models import MODEL_FALLBACKS
+    from skills.council.scripts.models import MODEL_FALLBACK_CHAINS
 except ImportError:
     # Fallback if skills not in path
     def get_gateway():
         return "http://localhost:4000/v1/chat/completions"
-    MODEL_FALLBACKS = {}
+    MODEL_FALLBACK_CHAINS = {}
 
 # Import Perplexity wrapper for web research
 try:
@@ -42,6 +49,82 @@ except ImportError:
     PerplexityWrapper = None
     PerplexityResponse = None
 
+# HTTP clients: httpx drives the gateway natively on the event loop; without
+# it, blocking requests calls run in worker threads. _GATEWAY_ERRORS are
+# the failures that mean the gateway itself is unreachable (asyncio's
+# TimeoutError is a streamed call running past its deadline)
+_TIMEOUT_ERRORS = (asyncio.TimeoutError,)
+_GATEWAY_ERRORS = (asyncio.TimeoutError,)
+try:
+    import httpx
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    _GATEWAY_ERRORS += (httpx.TransportError,)
+except ImportError:
+    httpx = None
+
+try:
+    import requests
+    _TIMEOUT_ERRORS += (requests.exceptions.Timeout,)
+    _GATEWAY_ERRORS += (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+except ImportError:
+    requests = None
+
+# Optional: orjson encodes payloads and decodes (large) completions faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Optional: sentence embeddings for SemanticCache
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    np = None
+    SentenceTransformer = None
+
+
+logger = logging.getLogger(__name__)
+
+# Id of the Diamond run being executed; set per run and inherited by the
+# asyncio tasks of its model calls, so their log records can be grouped
+_run_id: ContextVar[Optional[str]] = ContextVar("run_id", default=None)
+
+# Verdict keywords in model output, found in one case-insensitive scan
+_REC_RE = re.compile(r"APPROVED|REJECTED|CONDITIONAL|NEEDS_DEBATE", re.IGNORECASE)
+
+# Diamond stage prompts; only the query and the previous stage's output vary
+STAGE2_TPL = """Original Query: {query}
+
+Context from Stage 1:
+{context}
+
+Please analyze this proposal based on your role."""
+
+STAGE3_TPL = """Original Query: {query}
+
+Deliberation Results:
+{deliberation}
+
+As Semi-Final Judge, synthesize all perspectives and provide:
+1. Your assessment of the approach
+2. Any remaining concerns or gaps
+3. Recommendation: APPROVED (ready for Opus), CONDITIONAL (fix X first), NEEDS_DEBATE (major concerns)"""
+
+STAGE4_TPL = """Original Query: {query}
+
+Semi-Final Assessment:
+{synthesis}
+
+As Final Judge, issue your decree:
+1. APPROVED - Ready to build
+2. CONDITIONAL - Fix X first
+3. REJECTED - Not viable
+
+Provide clear rationale and implementation phases."""
+
 
 @dataclass
 class ModelResponse:
@@ -65,6 +148,14 @@ class ParallelResult:
     total_tokens: int
     success_count: int
     failure_count: int
+    _by_model: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Content of the first successful response per model, for lookups
+        self._by_model = {}
+        for r in self.responses:
+            if r.success:
+                self._by_model.setdefault(r.model, r.content)
 
     def get_successful_responses(self) -> List[ModelResponse]:
         """Get only successful responses."""
@@ -72,22 +163,18 @@ class ParallelResult:
 
     def get_model_content(self, model: str) -> Optional[str]:
         """Get content from a specific model."""
-        for r in self.responses:
-            if r.model == model and r.success:
-                return r.content
-        return None
+        return self._by_model.get(model)
 
     def format_for_synthesis(self) -> str:
         """Format responses for input to synthesizer model."""
-        output = ["## Parallel Deliberation Results\n"]
-
+        buf = io.StringIO()
+        buf.write("## Parallel Deliberation Results\n")
         for r in self.responses:
             if r.success:
-                output.append(f"### {r.model}\n{r.content}\n")
+                buf.write(f"\n### {r.model}\n{r.content}\n")
             else:
-                output.append(f"### {r.model} (FAILED)\nError: {r.error}\n")
-
-        return "\n".join(output)
+                buf.write(f"\n### {r.model} (FAILED)\nError: {r.error}\n")
+        return buf.getvalue()
 
 
 @dataclass
@@ -127,18 +214,170 @@ class DiamondDebateResult:
 
     def format_summary(self) -> str:
         """Format a summary of the debate results."""
-        output = [
-            "## Diamond Debate Summary\n",
-            f"Total Time: {self.total_latency:.2f}s",
-            f"Total Cost: ${self.total_cost:.4f}",
-            f"Total Tokens: {self.total_tokens}\n",
-            "### Step Timings:",
-            f"  Architect: {self.step1_architect.latency_seconds:.2f}s",
-            f"  Auditor: {self.step2_auditor.latency_seconds:.2f}s",
-            f"  Contextualist: {self.step3_contextualist.latency_seconds:.2f}s",
-            f"  Judge: {self.step4_judge.latency_seconds:.2f}s\n",
-        ]
-        return "\n".join(output)
+        return (
+            "## Diamond Debate Summary\n\n"
+            f"Total Time: {self.total_latency:.2f}s\n"
+            f"Total Cost: ${self.total_cost:.4f}\n"
+            f"Total Tokens: {self.total_tokens}\n\n"
+            "### Step Timings:\n"
+            f"  Architect: {self.step1_architect.latency_seconds:.2f}s\n"
+            f"  Auditor: {self.step2_auditor.latency_seconds:.2f}s\n"
+            f"  Contextualist: {self.step3_contextualist.latency_seconds:.2f}s\n"
+            f"  Judge: {self.step4_judge.latency_seconds:.2f}s\n"
+        )
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of successful ModelResponses, keyed by prompt hash.
+
+    Any object with the same get(key) / set(key, response) methods can be
+    passed to ParallelExecutor instead (e.g. a disk- or Redis-backed store).
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, key: str) -> Optional[ModelResponse]:
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: ModelResponse):
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class SemanticCache:
+    """
+    Cache of successful ModelResponses matched by prompt meaning.
+
+    Prompts are embedded with a sentence-transformers model; a stored
+    response is reused when the same model and system prompt saw a prompt
+    whose cosine similarity is at least `threshold` (so paraphrased debate
+    topics hit). Requires sentence-transformers; entries are evicted LRU.
+    lookup() runs in worker threads, so entries and the encoder are guarded
+    by locks.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.87,
+        max_entries: int = 256,
+        model_name: str = "all-MiniLM-L6-v2"
+    ):
+        if SentenceTransformer is None:
+            raise ImportError("SemanticCache requires sentence-transformers")
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self._encoder = None
+        self._entries = OrderedDict()  # id -> (model, system_prompt, embedding, response)
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._encoder_lock = threading.Lock()
+
+    def _embed(self, prompt: str):
+        if self._encoder is None:
+            with self._encoder_lock:
+                if self._encoder is None:
+                    # Loading the model is slow, so it waits for the first lookup
+                    self._encoder = SentenceTransformer(self.model_name)
+        return self._encoder.encode([prompt], normalize_embeddings=True)[0]
+
+    def lookup(self, model: str, system_prompt: Optional[str], prompt: str):
+        """
+        Find a response to a similar prompt.
+
+        Returns:
+            Tuple of (cached ModelResponse or None, prompt embedding)
+        """
+        embedding = self._embed(prompt)
+        with self._lock:
+            candidates = [
+                (entry_id, entry[2], entry[3]) for entry_id, entry in self._entries.items()
+                if entry[0] == model and entry[1] == system_prompt
+            ]
+        if not candidates:
+            return None, embedding
+
+        # Embeddings are normalized: the dot product is the cosine similarity
+        similarities = np.stack([vector for _, vector, _ in candidates]) @ embedding
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None, embedding
+
+        entry_id, _, response = candidates[best]
+        with self._lock:
+            if entry_id in self._entries:
+                self._entries.move_to_end(entry_id)
+        return response, embedding
+
+    def store(self, model: str, system_prompt: Optional[str], embedding, response: ModelResponse):
+        """Remember a response under the embedding returned by lookup()."""
+        with self._lock:
+            self._entries[self._next_id] = (model, system_prompt, embedding, response)
+            self._next_id += 1
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class CircuitBreaker:
+    """
+    Fail-fast guard for one gateway URL (closed -> open -> half-open).
+
+    After fail_max consecutive gateway failures the breaker opens and calls
+    are refused for reset_timeout seconds; then a single trial call is let
+    through, which closes the breaker again or re-opens it. A trial that
+    reports neither outcome (e.g. its task was cancelled) expires after
+    another reset_timeout, so the breaker cannot get stuck half-open.
+    """
+
+    def __init__(self, fail_max: int = 3, reset_timeout: float = 30):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_at = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Whether a call may go out now."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open":
+            now = time.monotonic()
+            if self._trial_at is None or now - self._trial_at >= self.reset_timeout:
+                self._trial_at = now
+                return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self._trial_at is not None or self.failures >= self.fail_max:
+            self.opened_at = time.monotonic()
+        self._trial_at = None
+
+
+# One breaker per gateway URL, shared by every executor talking to it
+_BREAKERS: Dict[str, CircuitBreaker] = {}
 
 
 class ParallelExecutor:
@@ -158,27 +397,240 @@ class ParallelExecutor:
     # Gateway URL
     GATEWAY_URL = "http://localhost:4000/v1/chat/completions"
 
+    # Provider prompt caching: model prefixes routed to Anthropic, and the
+    # minimum block size worth a cache breakpoint (~1024 tokens)
+    PROMPT_CACHE_MODEL_PREFIXES = ("claude-", "opus-")
+    PROMPT_CACHE_MIN_CHARS = 4096
+
+    # Simple cost estimation (would use pricing module)
+    # Conservative estimates per 1M tokens: (input, output)
+    PRICING = {
+        "claude-sonnet": (3.0, 15.0),
+        "deepseek-v3": (0.27, 1.10),
+        "gemini-flash": (0.075, 0.30),
+        "kimi-researcher": (1.20, 12.0),
+        "gemini-pro": (0.075, 0.30),
+        "opus-synthesis": (15.0, 75.0),
+    }
+
+    # Same prices per single token, so estimates need no division
+    _PRICING_PER_TOKEN = {
+        model: (input_price / 1_000_000, output_price / 1_000_000)
+        for model, (input_price, output_price) in PRICING.items()
+    }
+
     def __init__(
         self,
         gateway_url: Optional[str] = None,
         max_workers: int = 5,
-        default_timeout: int = DEFAULT_TIMEOUT
+        default_timeout: int = DEFAULT_TIMEOUT,
+        cache: Optional[Any] = None,
+        semantic_cache: Optional[SemanticCache] = None
     ):
         """
         Initialize the parallel executor.
 
         Args:
             gateway_url: LiteLLM gateway URL (default: localhost:4000)
-            max_workers: Maximum parallel threads
+            max_workers: Maximum model calls in flight at once
             default_timeout: Default timeout for each model call
+            cache: Optional response cache (e.g. ResponseCache()); identical
+                gateway calls are then answered without an HTTP request
+            semantic_cache: Optional SemanticCache, consulted after an exact
+                cache miss so paraphrased prompts are answered from cache too
         """
         self.gateway_url = gateway_url or self.GATEWAY_URL
+        if self.gateway_url not in _BREAKERS:
+            _BREAKERS[self.gateway_url] = CircuitBreaker(fail_max=3, reset_timeout=30)
+        self._breaker = _BREAKERS[self.gateway_url]
         self.max_workers = max_workers
         self.default_timeout = default_timeout
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.cache_stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
 
         # Perplexity wrapper (for perplexity-* models)
         self.perplexity = PerplexityWrapper() if PerplexityWrapper else None
 
+        # Pooled keep-alive connections to the gateway, created lazily: an
+        # httpx client bound to the loop that made it, or a requests session
+        self._client = None
+        self._client_loop = None
+        self._session = None
+
+        # Event loop behind the synchronous wrappers; kept between calls so
+        # pooled connections are reused from one stage to the next
+        self._loop = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _get_client(self):
+        """Get the shared httpx client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=30,
+                ),
+                timeout=httpx.Timeout(self.default_timeout),
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _get_session(self):
+        """Get the shared requests session (fallback when httpx is missing)."""
+        if self._session is None:
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self.max_workers,
+                pool_maxsize=self.max_workers * 2,
+                max_retries=0,
+            )
+            self._session = requests.Session()
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        return self._session
+
+    async def aclose(self):
+        """Close the httpx clients (call before their event loop ends)."""
+        if self.perplexity is not None:
+            await self.perplexity.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    def close(self):
+        """Close pooled connections and the event loop of the synchronous wrappers."""
+        if self._loop is not None:
+            perplexity_loop = getattr(self.perplexity, "_client_loop", None)
+            if self._loop in (self._client_loop, perplexity_loop):
+                self._loop.run_until_complete(self.aclose())
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            self._loop.close()
+            self._loop = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self.perplexity is not None:
+            self.perplexity.close()
+
+    def _run_sync(self, coro):
+        """Run a coroutine to completion from synchronous code."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    async def prewarm(self, connections: int = 1):
+        """
+        Open pooled connections to the gateway ahead of the calls that need them.
+
+        Sends lightweight HEAD requests so TCP/TLS setup is paid while an
+        earlier stage is still running; the response (and any error) is
+        ignored.
+        """
+        async def ping():
+            try:
+                if httpx is not None:
+                    await self._get_client().head(self.gateway_url, timeout=5)
+                else:
+                    await asyncio.to_thread(self._get_session().head, self.gateway_url, timeout=5)
+            except Exception:
+                pass
+
+        await asyncio.gather(*(ping() for _ in range(connections)))
+
+    @staticmethod
+    def _request_body(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Keyword arguments carrying payload as the POST body (orjson-encoded if available)."""
+        if orjson is None:
+            return {"json": payload}
+        body = orjson.dumps(payload)
+        if httpx is not None:
+            return {"content": body, "headers": _JSON_HEADERS}
+        return {"data": body, "headers": _JSON_HEADERS}
+
+    async def _post(self, payload: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+        """POST a chat completion payload to the gateway and decode the JSON reply."""
+        request = self._request_body(payload)
+
+        if httpx is not None:
+            response = await self._get_client().post(
+                self.gateway_url, timeout=timeout, **request
+            )
+        else:
+            response = await asyncio.to_thread(
+                self._get_session().post, self.gateway_url, timeout=timeout, **request
+            )
+        response.raise_for_status()
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    async def _post_stream(self, payload: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+        """
+        POST a payload with stream=True and assemble the server-sent deltas.
+
+        Returns the usual completion shape so callers parse it like _post().
+        Usage is requested in the final chunk (stream_options), otherwise
+        streamed calls would be recorded with no tokens and no cost.
+
+        The client timeout only bounds each read, so the whole stream is
+        also held to timeout (asyncio.TimeoutError past it).
+        """
+        request = self._request_body(
+            {**payload, "stream": True, "stream_options": {"include_usage": True}}
+        )
+        parts = []
+        usage = {}
+
+        def feed(line: str):
+            if not line.startswith("data:"):
+                return
+            data = line[5:].strip()
+            if not data or data == "[DONE]":
+                return
+            chunk = orjson.loads(data) if orjson is not None else json.loads(data)
+            if chunk.get("usage"):
+                usage.update(chunk["usage"])
+            choices = chunk.get("choices") or [{}]
+            text = (choices[0].get("delta") or {}).get("content")
+            if text:
+                parts.append(text)
+
+        if httpx is not None:
+            async def read_stream():
+                async with self._get_client().stream(
+                    "POST", self.gateway_url, timeout=timeout, **request
+                ) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        feed(line)
+
+            await asyncio.wait_for(read_stream(), timeout)
+        else:
+            def read():
+                with self._get_session().post(
+                    self.gateway_url, timeout=timeout, stream=True, **request
+                ) as response:
+                    response.raise_for_status()
+                    for line in response.iter_lines(decode_unicode=True):
+                        feed(line)
+
+            # A worker thread cannot be cancelled: past the deadline it is
+            # abandoned and finishes on its own read timeout
+            await asyncio.wait_for(asyncio.to_thread(read), timeout)
+
+        return {
+            "choices": [{"message": {"content": "".join(parts)}}],
+            "usage": usage,
+        }
+
     def _execute_model(
         self,
         model: str,
@@ -186,6 +638,33 @@ class ParallelExecutor:
         system_prompt: Optional[str] = None,
         max_tokens: int = 2000,
         timeout: Optional[int] = None
+    ) -> ModelResponse:
+        """
+        Execute a single model (synchronous wrapper).
+
+        Args:
+            model: Model name/alias
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            timeout: Request timeout
+
+        Returns:
+            ModelResponse with results
+        """
+        return self._run_sync(
+            self._execute_model_async(model, prompt, system_prompt, max_tokens, timeout)
+        )
+
+    async def _execute_model_async(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 2000,
+        timeout: Optional[int] = None,
+        user_message: Optional[Dict[str, Any]] = None,
+        stream: bool = False
     ) -> ModelResponse:
         """
         Execute a single model.
@@ -196,10 +675,40 @@ class ParallelExecutor:
             system_prompt: Optional system prompt
             max_tokens: Maximum tokens to generate
             timeout: Request timeout
+            user_message: Prebuilt user message for prompt, shared between
+                the models of one stage (built here if not given)
+            stream: Stream the completion over server-sent events
 
         Returns:
             ModelResponse with results
         """
+        response = await self._call_model_async(
+            model, prompt, system_prompt, max_tokens, timeout, user_message, stream
+        )
+        logger.info(
+            "model_call",
+            extra={
+                "run_id": _run_id.get(),
+                "model": response.model,
+                "success": response.success,
+                "latency": response.latency_seconds,
+                "cost": response.cost,
+                "error": response.error,
+            },
+        )
+        return response
+
+    async def _call_model_async(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        timeout: Optional[int],
+        user_message: Optional[Dict[str, Any]],
+        stream: bool
+    ) -> ModelResponse:
+        """Call one model (Perplexity, cache, or gateway with fallbacks)."""
         start_time = time.time()
         timeout = timeout or self.default_timeout
 
@@ -207,16 +716,20 @@ class ParallelExecutor:
         if model.startswith("perplexity-") and self.perplexity:
             try:
                 perplexity_model = "sonar-small-online" if model == "perplexity-researcher" else "sonar-medium-online"
-                result = self.perplexity.search(prompt, model=perplexity_model, timeout=timeout)
+                result = await self.perplexity.search_async(
+                    prompt, model=perplexity_model, timeout=timeout
+                )
 
                 # Format Perplexity results as content
-                content = f"## Web Research Results\n\n"
+                buf = io.StringIO()
+                buf.write("## Web Research Results\n\n")
                 if result.answer:
-                    content += f"{result.answer}\n\n"
+                    buf.write(f"{result.answer}\n\n")
 
-                content += f"### Sources ({len(result.citations)})\n"
+                buf.write(f"### Sources ({len(result.citations)})\n")
                 for i, citation in enumerate(result.citations, 1):
-                    content += f"{i}. [{citation.title}]({citation.url})\n"
+                    buf.write(f"{i}. [{citation.title}]({citation.url})\n")
+                content = buf.getvalue()
 
                 return ModelResponse(
                     model=model,
@@ -235,93 +748,150 @@ class ParallelExecutor:
                     error=str(e)
                 )
 
-        # Regular LLM model via gateway
-        try:
-            import requests
-
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-
-            payload = {
-                "model": model,
-                "messages": messages,
-                "max_tokens": max_tokens,
-            }
-
-            response = requests.post(
-                self.gateway_url,
-                json=payload,
-                timeout=timeout
+        # Regular LLM model via gateway, unless an identical call is cached
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._cache_key(model, system_prompt, prompt, max_tokens)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.cache_stats["hits"] += 1
+                return replace(cached, latency_seconds=0.0, cost=0.0)
+
+        embedding = None
+        if self.semantic_cache is not None:
+            # Embedding is CPU-bound: keep it off the event loop
+            cached, embedding = await asyncio.to_thread(
+                self.semantic_cache.lookup, model, system_prompt, prompt
             )
+            if cached is not None:
+                self.cache_stats["semantic_hits"] += 1
+                return replace(cached, latency_seconds=0.0, cost=0.0)
+
+        if self.cache is not None or self.semantic_cache is not None:
+            self.cache_stats["misses"] += 1
+
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": self._message_content(model, system_prompt)})
+        messages.append(user_message or {"role": "user", "content": self._message_content(model, prompt)})
+
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+        }
+
+        # Try the model, then each model in its precomputed fallback chain,
+        # reusing the same payload. All attempts share one deadline, so the
+        # whole chain never takes longer than timeout
+        deadline = time.monotonic() + timeout
+        error = f"Timeout after {timeout}s"
+        for candidate in MODEL_FALLBACK_CHAINS.get(model, (model,)):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            # Gateway known to be down: fail fast instead of waiting out
+            # a timeout for the model and again for every fallback
+            if not self._breaker.allow():
+                return ModelResponse(
+                    model=model,
+                    content="",
+                    success=False,
+                    latency_seconds=time.time() - start_time,
+                    error="circuit_open"
+                )
 
-            response.raise_for_status()
-            data = response.json()
+            payload["model"] = candidate
+            try:
+                if stream:
+                    data = await self._post_stream(payload, remaining)
+                else:
+                    data = await self._post(payload, remaining)
+            except _GATEWAY_ERRORS as e:
+                self._breaker.record_failure()
+                error = f"Timeout after {timeout}s" if isinstance(e, _TIMEOUT_ERRORS) else str(e)
+                continue
+            except Exception as e:
+                # The gateway answered (e.g. an HTTP error for this model)
+                self._breaker.record_success()
+                error = str(e)
+                continue
+            self._breaker.record_success()
+
+            try:
+                content = data["choices"][0]["message"]["content"]
+            except Exception as e:
+                error = str(e)
+                continue
 
-            content = data["choices"][0]["message"]["content"]
             usage = data.get("usage", {})
 
             # Estimate cost (would use pricing module in production)
             tokens_used = usage.get("total_tokens", 0)
-            cost = self._estimate_cost(model, usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0))
+            cost = self._estimate_cost(candidate, usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0))
 
-            return ModelResponse(
-                model=model,
+            response = ModelResponse(
+                model=candidate,
                 content=content,
                 success=True,
                 latency_seconds=time.time() - start_time,
                 cost=cost,
                 tokens_used=tokens_used,
             )
+            if candidate != model:
+                response.fallback_used = model
+                response.model = f"{model} (via {candidate})"
+                return response
+
+            # Store copies so callers cannot alter cached entries
+            if cache_key is not None:
+                self.cache.set(cache_key, replace(response))
+            if embedding is not None:
+                self.semantic_cache.store(model, system_prompt, embedding, replace(response))
+            return response
+
+        return ModelResponse(
+            model=model,
+            content="",
+            success=False,
+            latency_seconds=time.time() - start_time,
+            error=error
+        )
 
-        except requests.exceptions.Timeout:
-            # Try fallback if available
-            fallback = MODEL_FALLBACKS.get(model)
-            if fallback and fallback != model:
-                return self._execute_model(fallback, prompt, system_prompt, max_tokens, timeout)
-
-            return ModelResponse(
-                model=model,
-                content="",
-                success=False,
-                latency_seconds=timeout,
-                error=f"Timeout after {timeout}s"
-            )
+    @classmethod
+    def _message_content(cls, model: str, text: str):
+        """
+        Message content for the gateway payload.
 
-        except Exception as e:
-            # Try fallback if available
-            fallback = MODEL_FALLBACKS.get(model)
-            if fallback and fallback != model:
-                result = self._execute_model(fallback, prompt, system_prompt, max_tokens, timeout)
-                result.fallback_used = model
-                result.model = f"{model} (via {fallback})"
-                return result
-
-            return ModelResponse(
-                model=model,
-                content="",
-                success=False,
-                latency_seconds=time.time() - start_time,
-                error=str(e)
-            )
+        Long blocks sent to Anthropic-backed models carry an ephemeral
+        cache_control breakpoint, so the provider can reuse the prefix
+        across fallback retries and repeated debates. Other providers get
+        plain strings.
+        """
+        if cls._prompt_cacheable(model, text):
+            return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+        return text
+
+    @classmethod
+    def _prompt_cacheable(cls, model: str, text: str) -> bool:
+        """Whether a message block gets a cache_control breakpoint."""
+        return len(text) >= cls.PROMPT_CACHE_MIN_CHARS and model.startswith(cls.PROMPT_CACHE_MODEL_PREFIXES)
+
+    @staticmethod
+    def _cache_key(model: str, system_prompt: Optional[str], prompt: str, max_tokens: int) -> str:
+        """Hash of everything that determines a gateway response."""
+        return hashlib.sha256(json.dumps(
+            {"m": model, "sp": system_prompt, "p": prompt, "mt": max_tokens},
+            sort_keys=True,
+        ).encode()).hexdigest()
 
     def _estimate_cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
         """Estimate cost for a model call."""
-        # Simple cost estimation (would use pricing module)
-        # Conservative estimates per 1M tokens
-        pricing = {
-            "claude-sonnet": (3.0, 15.0),
-            "deepseek-v3": (0.27, 1.10),
-            "gemini-flash": (0.075, 0.30),
-            "kimi-researcher": (1.20, 12.0),
-            "gemini-pro": (0.075, 0.30),
-            "opus-synthesis": (15.0, 75.0),
-        }
-
-        if model in pricing:
-            input_price, output_price = pricing[model]
-            return (prompt_tokens / 1_000_000) * input_price + (completion_tokens / 1_000_000) * output_price
+        prices = self._PRICING_PER_TOKEN.get(model)
+        if prices is not None:
+            input_price, output_price = prices
+            return prompt_tokens * input_price + completion_tokens * output_price
 
         return 0.01  # Default estimate
 
@@ -331,7 +901,26 @@ class ParallelExecutor:
         prompt: str,
         system_prompts: Optional[Dict[str, str]] = None,
         max_tokens: int = 2000,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        stream: bool = False
+    ) -> ParallelResult:
+        """
+        Execute multiple models in parallel (synchronous wrapper).
+
+        See execute_parallel_async for arguments.
+        """
+        return self._run_sync(
+            self.execute_parallel_async(models, prompt, system_prompts, max_tokens, timeout, stream)
+        )
+
+    async def execute_parallel_async(
+        self,
+        models: List[str],
+        prompt: str,
+        system_prompts: Optional[Dict[str, str]] = None,
+        max_tokens: int = 2000,
+        timeout: Optional[int] = None,
+        stream: bool = False
     ) -> ParallelResult:
         """
         Execute multiple models in parallel.
@@ -342,42 +931,51 @@ class ParallelExecutor:
             system_prompts: Optional dict of model-specific system prompts
             max_tokens: Maximum tokens per model
             timeout: Timeout for each model
+            stream: Stream completions (see _execute_model_async)
 
         Returns:
-            ParallelResult with all responses
+            ParallelResult with all responses, in the order of models
         """
         system_prompts = system_prompts or {}
         start_time = time.time()
 
-        responses = []
-        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(models))) as executor:
-            # Submit all tasks
-            future_to_model = {
-                executor.submit(
-                    self._execute_model,
-                    model,
-                    prompt,
-                    system_prompts.get(model),
-                    max_tokens,
-                    timeout
-                ): model
-                for model in models
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_model):
-                model = future_to_model[future]
+        # At most max_workers model calls in flight at once
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        # The user message is the same for every model in the stage: build
+        # it once per content variant (plain, or with a cache breakpoint)
+        user_messages = {}
+
+        def user_message_for(model: str) -> Dict[str, Any]:
+            variant = self._prompt_cacheable(model, prompt)
+            if variant not in user_messages:
+                user_messages[variant] = {"role": "user", "content": self._message_content(model, prompt)}
+            return user_messages[variant]
+
+        async def run(model: str) -> ModelResponse:
+            async with semaphore:
                 try:
-                    response = future.result()
-                    responses.append(response)
+                    return await self._execute_model_async(
+                        model, prompt, system_prompts.get(model), max_tokens, timeout,
+                        user_message=user_message_for(model), stream=stream,
+                    )
                 except Exception as e:
-                    responses.append(ModelResponse(
+                    # One failing model must not cancel its siblings
+                    return ModelResponse(
                         model=model,
                         content="",
                         success=False,
                         latency_seconds=0,
                         error=f"Execution error: {e}"
-                    ))
+                    )
+
+        if hasattr(asyncio, "TaskGroup"):
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(run(model)) for model in models]
+            responses = [task.result() for task in tasks]
+        else:
+            # Python < 3.11: no TaskGroup
+            responses = list(await asyncio.gather(*(run(model) for model in models)))
 
         total_latency = time.time() - start_time
 
@@ -402,6 +1000,20 @@ class ParallelExecutor:
         prompt: str,
         models: Optional[List[str]] = None,
         **kwargs
+    ) -> ParallelResult:
+        """
+        Execute a predefined Diamond Architecture stage (synchronous wrapper).
+
+        See execute_stage_async for arguments.
+        """
+        return self._run_sync(self.execute_stage_async(stage_name, prompt, models, **kwargs))
+
+    async def execute_stage_async(
+        self,
+        stage_name: str,
+        prompt: str,
+        models: Optional[List[str]] = None,
+        **kwargs
     ) -> ParallelResult:
         """
         Execute a predefined Diamond Architecture stage.
@@ -410,7 +1022,7 @@ class ParallelExecutor:
             stage_name: Stage name ("stage1_context", "stage2_deliberate", "stage3_synthesize")
             prompt: Prompt for this stage
             models: Optional override of default models for this stage
-            **kwargs: Additional arguments for execute_parallel
+            **kwargs: Additional arguments for execute_parallel_async
 
         Returns:
             ParallelResult for this stage
@@ -451,12 +1063,13 @@ class ParallelExecutor:
         system_prompts = kwargs.get("system_prompts", config["system_prompts"])
         max_tokens = kwargs.get("max_tokens", config["max_tokens"])
 
-        return self.execute_parallel(
+        return await self.execute_parallel_async(
             models=models,
             prompt=prompt,
             system_prompts=system_prompts,
             max_tokens=max_tokens,
             timeout=kwargs.get("timeout"),
+            stream=kwargs.get("stream", False),
         )
 
 
@@ -475,15 +1088,44 @@ class DiamondOrchestrator:
       Stage 4 (CONDITIONAL): opus → ratification
     """
 
+    # Models in the Stage 2 deliberation fan-out (connections to pre-open)
+    STAGE2_WIDTH = 3
+
     def __init__(self, executor: Optional[ParallelExecutor] = None):
         self.executor = executor or ParallelExecutor()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Release the executor's pooled gateway connections."""
+        self.executor.close()
+
     def execute_diamond(
         self,
         query: str,
         context: str = "",
         invoke_opus: bool = False,
         opus_threshold: str = "conditional"
+    ) -> Dict[str, Any]:
+        """
+        Execute the full Diamond Architecture (synchronous wrapper).
+
+        See execute_diamond_async for arguments.
+        """
+        return self.executor._run_sync(
+            self.execute_diamond_async(query, context, invoke_opus, opus_threshold)
+        )
+
+    async def execute_diamond_async(
+        self,
+        query: str,
+        context: str = "",
+        invoke_opus: bool = False,
+        opus_threshold: str = "conditional"
     ) -> Dict[str, Any]:
         """
         Execute the full Diamond Architecture.
@@ -497,9 +1139,27 @@ class DiamondOrchestrator:
         Returns:
             Dict with stage results and final recommendation
         """
+        run_id = uuid.uuid4().hex
+        # Tag this run's log records, and restore the caller's run id after
+        token = _run_id.set(run_id)
+        try:
+            return await self._execute_diamond(run_id, query, context, invoke_opus, opus_threshold)
+        finally:
+            _run_id.reset(token)
+
+    async def _execute_diamond(
+        self,
+        run_id: str,
+        query: str,
+        context: str,
+        invoke_opus: bool,
+        opus_threshold: str
+    ) -> Dict[str, Any]:
+        """Body of execute_diamond_async, run with _run_id set."""
         full_prompt = f"Query: {query}\n\n{context}".strip()
 
         results = {
+            "run_id": run_id,
             "query": query,
             "stages": {},
             "final_recommendation": None,
@@ -507,35 +1167,31 @@ class DiamondOrchestrator:
             "total_latency": 0,
         }
 
-        # Stage 1: Context Acquisition (Parallel)
-        stage1 = self.executor.execute_stage("stage1_context", full_prompt)
+        # Stage 1: Context Acquisition (Parallel), while extra gateway
+        # connections are opened for the wider Stage 2 fan-out
+        stage1, _ = await asyncio.gather(
+            self.executor.execute_stage_async("stage1_context", full_prompt),
+            self.executor.prewarm(self.STAGE2_WIDTH),
+        )
         results["stages"]["context"] = stage1
         results["total_cost"] += stage1.total_cost
 
         # Build prompt for Stage 2 with Stage 1 context
-        stage2_prompt = f"""Original Query: {query}
-
-Context from Stage 1:
-{stage1.format_for_synthesis()}
-
-Please analyze this proposal based on your role."""
+        stage2_prompt = STAGE2_TPL.format_map(
+            {"query": query, "context": stage1.format_for_synthesis()}
+        )
         # Stage 2: Deliberation (Parallel)
-        stage2 = self.executor.execute_stage("stage2_deliberate", stage2_prompt)
+        stage2 = await self.executor.execute_stage_async("stage2_deliberate", stage2_prompt)
         results["stages"]["deliberation"] = stage2
         results["total_cost"] += stage2.total_cost
 
         # Build prompt for Stage 3 with Stage 2 deliberation
-        stage3_prompt = f"""Original Query: {query}
-
-Deliberation Results:
-{stage2.format_for_synthesis()}
-
-As Semi-Final Judge, synthesize all perspectives and provide:
-1. Your assessment of the approach
-2. Any remaining concerns or gaps
-3. Recommendation: APPROVED (ready for Opus), CONDITIONAL (fix X first), NEEDS_DEBATE (major concerns)"""
-        # Stage 3: Synthesis (Sequential)
-        stage3 = self.executor.execute_stage("stage3_synthesize", stage3_prompt)
+        stage3_prompt = STAGE3_TPL.format_map(
+            {"query": query, "deliberation": stage2.format_for_synthesis()}
+        )
+        # Stage 3: Synthesis (Sequential), streamed so the long generation
+        # is not cut off by an idle read timeout
+        stage3 = await self.executor.execute_stage_async("stage3_synthesize", stage3_prompt, stream=True)
         results["stages"]["synthesis"] = stage3
         results["total_cost"] += stage3.total_cost
 
@@ -545,19 +1201,11 @@ As Semi-Final Judge, synthesize all perspectives and provide:
 
         # Stage 4: Opus Ratification (Conditional)
         if invoke_opus and self._should_invoke_opus(results["final_recommendation"], opus_threshold):
-            stage4_prompt = f"""Original Query: {query}
-
-Semi-Final Assessment:
-{synthesis_content}
-
-As Final Judge, issue your decree:
-1. APPROVED - Ready to build
-2. CONDITIONAL - Fix X first
-3. REJECTED - Not viable
-
-Provide clear rationale and implementation phases."""
+            stage4_prompt = STAGE4_TPL.format_map(
+                {"query": query, "synthesis": synthesis_content}
+            )
 
-            stage4 = self.executor.execute_parallel(
+            stage4 = await self.executor.execute_parallel_async(
                 models=["opus-synthesis"],
                 prompt=stage4_prompt,
                 system_prompts={"opus-synthesis": "You are the Final Judge. Review the semi-final assessment and issue a final decree with clear rationale."},
@@ -579,13 +1227,13 @@ Provide clear rationale and implementation phases."""
 
     def _extract_recommendation(self, content: str) -> str:
         """Extract recommendation from model content."""
-        content_upper = content.upper()
+        found = {match.upper() for match in _REC_RE.findall(content)}
 
-        if "APPROVED" in content_upper and "CONDITIONAL" not in content_upper:
+        if "APPROVED" in found and "CONDITIONAL" not in found:
             return "APPROVED"
-        elif "REJECTED" in content_upper:
+        elif "REJECTED" in found:
             return "REJECTED"
-        elif "CONDITIONAL" in content_upper or "NEEDS_DEBATE" in content_upper:
+        elif "CONDITIONAL" in found or "NEEDS_DEBATE" in found:
             return "CONDITIONAL"
         else:
             return "UNCLEAR"
@@ -605,10 +1253,27 @@ Provide clear rationale and implementation phases."""
         self,
         topic: str,
         focus: Optional[str] = None,
-        context: str = ""
+        context: str = "",
+        depends_on_critique: bool = False
+    ) -> DiamondDebateResult:
+        """
+        Execute the 4-step Diamond debate workflow (synchronous wrapper).
+
+        See execute_diamond_debate_async for arguments.
+        """
+        return self.executor._run_sync(
+            self.execute_diamond_debate_async(topic, focus, context, depends_on_critique)
+        )
+
+    async def execute_diamond_debate_async(
+        self,
+        topic: str,
+        focus: Optional[str] = None,
+        context: str = "",
+        depends_on_critique: bool = False
     ) -> DiamondDebateResult:
         """
-        Execute the 4-step sequential Diamond debate workflow.
+        Execute the 4-step Diamond debate workflow.
 
         This is the team-debate-4step.ps1 workflow:
         Step 1: Architect (gemini-architect) → proposes solution
@@ -616,16 +1281,35 @@ Provide clear rationale and implementation phases."""
         Step 3: Contextualist (kimi-researcher) → codebase-aware analysis
         Step 4: Judge (opus-synthesis) → final decree
 
-        Each step sees the previous steps' output (sequential, not parallel).
+        Steps 2 and 3 both review the Architect's proposal and run
+        concurrently; the Judge sees all three outputs. With
+        depends_on_critique=True the Contextualist also reads the Auditor's
+        critique, so the steps run strictly in sequence.
 
         Args:
             topic: The topic or problem statement for the debate
             focus: Optional focus area (security, scalability, cost, performance, etc.)
             context: Additional context (file contents, codebase info, etc.)
+            depends_on_critique: Show the Auditor's critique to the Contextualist
 
         Returns:
             DiamondDebateResult with all 4 steps' responses
         """
+        token = _run_id.set(uuid.uuid4().hex)
+        try:
+            return await self._execute_diamond_debate(topic, focus, context, depends_on_critique)
+        finally:
+            _run_id.reset(token)
+
+    async def _execute_diamond_debate(
+        self,
+        topic: str,
+        focus: Optional[str],
+        context: str,
+        depends_on_critique: bool
+    ) -> DiamondDebateResult:
+        """Body of execute_diamond_debate_async, run with _run_id set."""
+        start_time = time.time()
         focus_prompt = f" Focus your analysis on: {focus}." if focus else ""
 
         # Step 1: Architect (Gemini 3 Pro)
@@ -641,7 +1325,7 @@ Structure your response as:
 
 Be concise but thorough."""
 
-        step1 = self.executor._execute_model(
+        step1 = await self.executor._execute_model_async(
             model="gemini-architect",
             prompt=step1_prompt,
             max_tokens=3000,
@@ -674,21 +1358,26 @@ Focus on:
 
 Provide specific, actionable critique."""
 
-        step2 = self.executor._execute_model(
+        step2_call = self.executor._execute_model_async(
             model="deepseek-v3",
             prompt=step2_prompt,
             max_tokens=4000,
             timeout=90
         )
+        if depends_on_critique:
+            step2 = await step2_call
+            critique_section = f"""
+
+AUDITOR'S CRITIQUE:
+{step2.content}"""
+        else:
+            critique_section = ""
 
         # Step 3: Contextualist (Kimi K2 Turbo)
         step3_prompt = f"""You are the Contextualist with 256k context awareness. Analyze this proposal and critique from the perspective of: existing codebase patterns, integration points, historical decisions, and project context.
 
 PROPOSAL:
-{step1.content}
-
-AUDITOR'S CRITIQUE:
-{step2.content}
+{step1.content}{critique_section}
 
 Provide:
 1) Connection to existing codebase patterns
@@ -700,12 +1389,17 @@ Be specific about what already exists in the codebase that should be leveraged o
 
 {context if context else ""}"""
 
-        step3 = self.executor._execute_model(
+        step3_call = self.executor._execute_model_async(
             model="kimi-researcher",
             prompt=step3_prompt,
             max_tokens=5000,
             timeout=180
         )
+        if depends_on_critique:
+            step3 = await step3_call
+        else:
+            # Independent reviews of the proposal: run them side by side
+            step2, step3 = await asyncio.gather(step2_call, step3_call)
 
         # Step 4: Judge (Claude Opus)
         step4_prompt = f"""You are the Supreme Court Judge. Synthesize a final decision based on this proposal, critique, and context-aware analysis.
@@ -726,20 +1420,15 @@ Weigh all perspectives and issue a final decree with:
 
 Be decisive and actionable."""
 
-        step4 = self.executor._execute_model(
+        step4 = await self.executor._execute_model_async(
             model="opus-synthesis",
             prompt=step4_prompt,
             max_tokens=64000,
             timeout=180
         )
 
-        # Calculate totals
-        total_latency = sum([
-            step1.latency_seconds,
-            step2.latency_seconds,
-            step3.latency_seconds,
-            step4.latency_seconds,
-        ])
+        # Calculate totals (latency is wall-clock: steps 2 and 3 overlap)
+        total_latency = time.time() - start_time
         total_cost = sum([
             step1.cost,
             step2.cost,
@@ -8,11 +8,40 @@ Addresses Council Blocker: Path handling issues on Windows
 - Handle MINGW paths
 """
 
-import re
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Windows illegal filename characters: < > : " / \ | ? *, each mapped to "_"
+_ILLEGAL_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
+
+def _home_key() -> tuple:
+    """The environment Path.home() resolves from; home-derived caches key on it."""
+    return os.environ.get("HOME"), os.environ.get("USERPROFILE")
+
+
+@lru_cache(maxsize=8)
+def _home_paths(key: tuple) -> tuple:
+    """
+    Home directory strings for one home setting (see _home_key).
+
+    Resolved on first use rather than at import, and cached per key so a
+    HOME change while the process runs is picked up.
+
+    Returns:
+        Tuple of (home, case-folded home, case-folded prefix of paths below it)
+    """
+    home = str(Path.home())
+    folded = os.path.normcase(home)
+    return home, folded, os.path.join(folded, "")
+
+
+# Council directory that ensure_directories() last created
+_ENSURED_DIR = None
+
 
 def convert_posix_to_windows(path: str) -> str:
     """
@@ -30,7 +59,7 @@ def convert_posix_to_windows(path: str) -> str:
         return path
 
     # If it looks like a Windows path already, return as-is
-    if re.match(r'^[A-Za-z]:\\', path):
+    if path[1:3] == ':\\' and path[0].isascii() and path[0].isalpha():
         return path
 
     # Replace forward slashes with backslashes
@@ -38,12 +67,12 @@ def convert_posix_to_windows(path: str) -> str:
 
     # Handle ~ expansion
     if path.startswith('~\\'):
-        home = str(Path.home())
-        path = home + path[1:]
+        path = _home_paths(_home_key())[0] + path[1:]
 
     return path
 
 
+@lru_cache(maxsize=256)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for Windows compatibility.
@@ -59,17 +88,21 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         return filename
 
-    # Windows illegal characters: < > : " / \ | ? *
-    illegal_chars = r'[<>:"/\\|?*]'
-    filename = re.sub(illegal_chars, '_', filename)
+    # Replace Windows illegal characters
+    filename = filename.translate(_ILLEGAL_TRANS)
 
     # Remove leading/trailing spaces and dots
     filename = filename.strip('. ')
 
     # Limit length (Windows max is 255, but let's be safe)
+    # keeping a short extension (found with rfind: no separators or
+    # leading dots are left by now)
     if len(filename) > 200:
-        name, ext = os.path.splitext(filename)
-        filename = name[:200 - len(ext)] + ext
+        dot = filename.rfind('.')
+        if dot > 0 and len(filename) - dot <= 8:
+            filename = filename[:200 - (len(filename) - dot)] + filename[dot:]
+        else:
+            filename = filename[:200]
 
     return filename
 
@@ -90,18 +123,22 @@ def sanitize_path_for_display(path: str) -> str:
     # Convert to Path object for manipulation
     p = Path(path)
 
-    # Try to make relative to home directory
-    try:
-        home = Path.home()
-        if p.is_absolute():
-            try:
-                rel = p.relative_to(home)
-                return f"~/{rel}"
-            except ValueError:
-                # Not under home, return just filename
-                return p.name
-    except Exception:
-        pass
+    # Try to make relative to home directory. str(p) is already
+    # normalized, so a prefix check (case-folded like the OS does) answers
+    # what relative_to() would, without comparing path components
+    if p.is_absolute():
+        try:
+            _, home_folded, home_prefix = _home_paths(_home_key())
+        except Exception:
+            return p.name
+        full = str(p)
+        folded = os.path.normcase(full)
+        if folded.startswith(home_prefix):
+            return f"~/{full[len(home_prefix):]}"
+        if folded == home_folded:
+            return "~/."
+        # Not under home, return just filename
+        return p.name
 
     # Fallback: return just filename
     return p.name
@@ -120,23 +157,47 @@ def safe_path_join(*parts: str) -> str:
     return str(Path(*parts).as_posix())
 
 
+@lru_cache(maxsize=8)
+def _council_dirs(key: tuple) -> tuple:
+    """
+    Council directories for one home setting (see _home_key).
+
+    Returns:
+        Tuple of (council dir, build plans dir, build plans dir as a str)
+    """
+    council_dir = Path(_home_paths(key)[0]) / ".claude" / "skills" / "council"
+    build_plans_dir = council_dir / "build-plans"
+    return council_dir, build_plans_dir, str(build_plans_dir)
+
+
 def get_council_dir() -> Path:
     """Get the council skill directory."""
-    return Path.home() / ".claude" / "skills" / "council"
+    return _council_dirs(_home_key())[0]
 
 
 def get_build_plans_dir() -> Path:
     """Get the build plans directory."""
-    return get_council_dir() / "build-plans"
+    return _council_dirs(_home_key())[1]
+
+
+def get_build_plans_dir_str() -> str:
+    """Get the build plans directory as a string, for joining with os.path."""
+    return _council_dirs(_home_key())[2]
 
 
 def ensure_directories() -> None:
-    """Ensure all required directories exist."""
+    """Ensure all required directories exist (checked once per council directory)."""
+    global _ENSURED_DIR
+    council_dir, build_plans_dir, _ = _council_dirs(_home_key())
+    if council_dir == _ENSURED_DIR:
+        return
+
     dirs = [
-        get_council_dir(),
-        get_build_plans_dir(),
-        get_council_dir() / "scripts",
-        get_council_dir() / "references",
+        council_dir,
+        build_plans_dir,
+        council_dir / "scripts",
+        council_dir / "references",
     ]
     for d in dirs:
         d.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIR = council_dir
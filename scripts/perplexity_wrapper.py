@@ -9,11 +9,19 @@ Models: sonar-small-online, sonar-medium-online
 """
 
 import os
-import json
+import re
 import sys
+import time
+import warnings
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
-from datetime import datetime
+
+# Optional: async HTTP client for search_async (falls back to a thread)
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -25,6 +33,46 @@ try:
 except ImportError:
     PATH_RESOLVER = None
 
+# Query sanitization patterns
+# Windows paths: C:\Users\... or C:/Users/...
+_WIN_PATH_RE = re.compile(r'[A-Za-z]:[/\\][^ \t\n\r\f\v<>|"\'\']+')
+# Unix paths: /home/user/ or \path\to\
+_UNIX_PATH_RE = re.compile(r'[/\\][a-zA-Z][a-zA-Z0-9_.-]+([/\\][a-zA-Z0-9_.-]+)*')
+# Hex strings that might be identifiers
+_HEX_RE = re.compile(r'0x[0-9a-fA-F]+')
+
+
+@lru_cache(maxsize=256)
+def _cached_sanitize(query: str) -> tuple[str, tuple]:
+    """
+    Sanitize a query for PerplexityWrapper.sanitize_query.
+
+    Memoized, since refinement and fact-checking loops sanitize the same
+    queries again. The replacements are returned as an immutable tuple of
+    (original, placeholder) pairs because cached values are shared.
+    """
+    # Placeholder for sanitization - would use identifier_replacer.py
+    # For now, just return the query as-is with a warning
+    # TODO: Implement proper identifier replacement via security/identifier_replacer.py
+
+    sanitized = query
+    replacements = ()
+
+    # Basic sanitization patterns (would be expanded in production).
+    # Each pattern needs a literal that most queries lack, so the
+    # substring checks skip whole regex passes over the query
+    # Remove file paths
+    if ':' in sanitized:
+        sanitized = _WIN_PATH_RE.sub('<PATH>', sanitized)
+    if '/' in sanitized or '\\' in sanitized:
+        sanitized = _UNIX_PATH_RE.sub('<PATH>', sanitized)
+
+    # Remove hex strings that might be identifiers
+    if '0x' in sanitized:
+        sanitized = _HEX_RE.sub('<HEX>', sanitized)
+
+    return sanitized, replacements
+
 
 @dataclass
 class SearchResult:
@@ -77,12 +125,14 @@ class PerplexityWrapper:
 
     DEFAULT_MODEL = "sonar-medium-online"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, client: Optional[Any] = None):
         """
         Initialize the Perplexity wrapper.
 
         Args:
             api_key: Perplexity API key (defaults to PERPLEXITY_API_KEY env var)
+            client: Optional httpx.AsyncClient for search_async (one is
+                created on first use otherwise; unused without httpx)
         """
         self.api_key = api_key or os.environ.get("PERPLEXITY_API_KEY")
         if not self.api_key:
@@ -91,6 +141,73 @@ class PerplexityWrapper:
                 "Set environment variable or pass api_key parameter."
             )
 
+        # Keep-alive connections to the API, so searches after the first
+        # skip the TLS handshake
+        self._client = client
+        self._client_loop = None
+        self._owns_client = client is None
+        self._session = None
+
+    def _get_client(self):
+        """Get the httpx client for the running event loop."""
+        if not self._owns_client:
+            return self._client
+        import asyncio
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            if self._client is not None:
+                self._discard_client(self._client, self._client_loop)
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30)
+            )
+            self._client_loop = loop
+        return self._client
+
+    @staticmethod
+    def _discard_client(client, loop):
+        """
+        Release a client left over from another event loop.
+
+        Its connections belong to that loop, so it is closed there if the
+        loop is still running; otherwise it cannot be closed from here and
+        a ResourceWarning points at the missing aclose().
+        """
+        import asyncio
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        warnings.warn(
+            "PerplexityWrapper: discarding an httpx client whose event loop "
+            "has finished; call aclose() before the loop ends",
+            ResourceWarning,
+            stacklevel=4,
+        )
+
+    def _get_session(self):
+        """Get the shared requests session used by search()."""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            self._session.headers.update(self._headers())
+            self._session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16),
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the httpx client created by search_async."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    def close(self):
+        """Close the requests session used by search()."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def sanitize_query(self, query: str) -> tuple[str, Dict[str, str]]:
         """
         Sanitize query for external API calls.
@@ -103,25 +220,9 @@ class PerplexityWrapper:
         Returns:
             Tuple of (sanitized_query, replacement_map)
         """
-        # Placeholder for sanitization - would use identifier_replacer.py
-        # For now, just return the query as-is with a warning
-        # TODO: Implement proper identifier replacement via security/identifier_replacer.py
-
-        sanitized = query
-        replacement_map = {}
-
-        # Basic sanitization patterns (would be expanded in production)
-        # Remove file paths
-        import re
-        # Windows paths: C:\Users\... or C:/Users/...
-        sanitized = re.sub(r'[A-Za-z]:[/\\][^ \t\n\r\f\v<>|"\'\']+', '<PATH>', sanitized)
-        # Unix paths: /home/user/ or \path\to\
-        sanitized = re.sub(r'[/\\][a-zA-Z][a-zA-Z0-9_.-]+([/\\][a-zA-Z0-9_.-]+)*', '<PATH>', sanitized)
-
-        # Remove hex strings that might be identifiers
-        sanitized = re.sub(r'0x[0-9a-fA-F]+', '<HEX>', sanitized)
-
-        return sanitized, replacement_map
+        # Cached per query string; the map is copied so callers may modify it
+        sanitized, replacements = _cached_sanitize(query)
+        return sanitized, dict(replacements)
 
     def unsanitize_response(self, response: str, replacement_map: Dict[str, str]) -> str:
         """Restore sanitized placeholders with original values."""
@@ -130,6 +231,79 @@ class PerplexityWrapper:
             response = response.replace(placeholder, original)
         return response
 
+    def _prepare(self, query: str, model: str, max_results: int) -> tuple[Dict[str, Any], Dict[str, str]]:
+        """Validate the model and build the search payload for a query."""
+        if model not in self.MODELS:
+            raise PerplexityAPIError(
+                f"Unknown model: {model}. "
+                f"Available: {list(self.MODELS.keys())}"
+            )
+
+        # Sanitize query before external API call
+        sanitized_query, replacement_map = self.sanitize_query(query)
+
+        payload = {
+            "model": self.MODELS[model]["model"],
+            "query": sanitized_query,
+            "max_results": max_results,
+        }
+        return payload, replacement_map
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _parse_response(
+        self,
+        data: Dict[str, Any],
+        model: str,
+        replacement_map: Dict[str, str],
+        start_time: float
+    ) -> PerplexityResponse:
+        """Turn a decoded search reply into a PerplexityResponse."""
+        # Parse response - Perplexity API returns "results" array
+        results_data = data.get("results", [])
+        citations = []
+
+        # Build answer from snippets (or return first snippet as answer)
+        answer_parts = []
+        for result in results_data:
+            snippet = result.get("snippet", "")
+            if snippet:
+                answer_parts.append(snippet)
+
+            # Also add to citations
+            citations.append(SearchResult(
+                title=result.get("title", ""),
+                url=result.get("url", ""),
+                snippet=snippet,
+                score=0.0,  # Perplexity doesn't return scores
+                source="perplexity"
+            ))
+
+        # Use first snippet as primary answer, or concatenate all
+        answer = answer_parts[0] if answer_parts else ""
+
+        # Unsanitize answer (restore placeholders if any)
+        answer = self.unsanitize_response(answer, replacement_map)
+
+        # Calculate metadata
+        latency_seconds = time.monotonic() - start_time
+        tokens_used = len(answer) // 4  # Rough estimate
+
+        cost = self.MODELS[model]["cost_per_search"]
+
+        return PerplexityResponse(
+            answer=answer,
+            citations=citations,
+            model=model,
+            tokens_used=tokens_used,
+            cost=cost,
+            latency_seconds=latency_seconds,
+        )
+
     def search(
         self,
         query: str,
@@ -154,87 +328,70 @@ class PerplexityWrapper:
         """
         import requests
 
-        if model not in self.MODELS:
-            raise PerplexityAPIError(
-                f"Unknown model: {model}. "
-                f"Available: {list(self.MODELS.keys())}"
+        payload, replacement_map = self._prepare(query, model, max_results)
+        start_time = time.monotonic()
+
+        try:
+            response = self._get_session().post(
+                f"{self.API_BASE}/search",
+                json=payload,
+                timeout=timeout
             )
 
-        # Sanitize query before external API call
-        sanitized_query, replacement_map = self.sanitize_query(query)
+            response.raise_for_status()
 
-        # Prepare request
-        url = f"{self.API_BASE}/search"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        payload = {
-            "model": self.MODELS[model]["model"],
-            "query": sanitized_query,
-            "max_results": max_results,
-        }
+            return self._parse_response(response.json(), model, replacement_map, start_time)
 
-        start_time = datetime.now()
+        except requests.exceptions.Timeout:
+            raise PerplexityAPIError(f"Request timed out after {timeout}s")
+        except requests.exceptions.ConnectionError:
+            raise PerplexityAPIError("Failed to connect to Perplexity API")
+        except requests.exceptions.HTTPError as e:
+            raise PerplexityAPIError(f"HTTP {e.response.status_code}: {e.response.text}")
+        except KeyError as e:
+            raise PerplexityAPIError(f"Unexpected response format: {e}")
+        except Exception as e:
+            raise PerplexityAPIError(f"Unexpected error: {e}")
+
+    async def search_async(
+        self,
+        query: str,
+        model: str = DEFAULT_MODEL,
+        max_results: int = 5,
+        timeout: int = 30
+    ) -> PerplexityResponse:
+        """
+        Async version of search() on a pooled httpx client.
+
+        Runs search() in a worker thread when httpx is not installed (an
+        injected client is then ignored: its errors could not be told apart).
+        """
+        if httpx is None:
+            import asyncio
+            return await asyncio.to_thread(
+                self.search, query, model=model, max_results=max_results, timeout=timeout
+            )
+
+        payload, replacement_map = self._prepare(query, model, max_results)
+        start_time = time.monotonic()
 
         try:
-            response = requests.post(
-                url,
-                headers=headers,
+            response = await self._get_client().post(
+                f"{self.API_BASE}/search",
+                headers=self._headers(),
                 json=payload,
                 timeout=timeout
             )
 
             response.raise_for_status()
 
-            data = response.json()
-
-            # Parse response - Perplexity API returns "results" array
-            results_data = data.get("results", [])
-            citations = []
-
-            # Build answer from snippets (or return first snippet as answer)
-            answer_parts = []
-            for result in results_data:
-                snippet = result.get("snippet", "")
-                if snippet:
-                    answer_parts.append(snippet)
-
-                # Also add to citations
-                citations.append(SearchResult(
-                    title=result.get("title", ""),
-                    url=result.get("url", ""),
-                    snippet=snippet,
-                    score=0.0,  # Perplexity doesn't return scores
-                    source="perplexity"
-                ))
-
-            # Use first snippet as primary answer, or concatenate all
-            answer = answer_parts[0] if answer_parts else ""
-
-            # Unsanitize answer (restore placeholders if any)
-            answer = self.unsanitize_response(answer, replacement_map)
-
-            # Calculate metadata
-            latency_seconds = (datetime.now() - start_time).total_seconds()
-            tokens_used = len(answer) // 4  # Rough estimate
-
-            cost = self.MODELS[model]["cost_per_search"]
-
-            return PerplexityResponse(
-                answer=answer,
-                citations=citations,
-                model=model,
-                tokens_used=tokens_used,
-                cost=cost,
-                latency_seconds=latency_seconds,
-            )
+            return self._parse_response(response.json(), model, replacement_map, start_time)
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             raise PerplexityAPIError(f"Request timed out after {timeout}s")
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             raise PerplexityAPIError("Failed to connect to Perplexity API")
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             raise PerplexityAPIError(f"HTTP {e.response.status_code}: {e.response.text}")
         except KeyError as e:
             raise PerplexityAPIError(f"Unexpected response format: {e}")
@@ -269,6 +426,38 @@ class PerplexityWrapper:
         response = self.search(query, max_results=max_results)
         return response.citations
 
+    def batch_search(
+        self,
+        queries: List[str],
+        model: str = DEFAULT_MODEL,
+        max_results: int = 5,
+        timeout: int = 30,
+        max_workers: int = 8
+    ) -> List[PerplexityResponse]:
+        """
+        Run several searches concurrently (e.g. for fact-checking).
+
+        Args:
+            queries: Search queries
+            model: Perplexity model to use
+            max_results: Maximum number of citations per query
+            timeout: Request timeout in seconds, per query
+            max_workers: Maximum searches in flight at once
+
+        Returns:
+            List of PerplexityResponse objects, in query order
+
+        Raises:
+            PerplexityAPIError: If any of the searches fails
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(
+                lambda query: self.search(query, model=model, max_results=max_results, timeout=timeout),
+                queries,
+            ))
+
 
 # ============================================================================
 # CLI Testing
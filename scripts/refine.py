@@ -46,6 +46,25 @@ try:
 except ImportError:
     TRACKING_AVAILABLE = False
 
+# Review prompt sent in every refinement round
+_PROMPT_TEMPLATE = """You are a {role}. Your task is to review and refine the following text.
+
+INPUT TO REFINE:
+{refined_output}
+
+{context}
+
+Your CRITICAL REVIEW must:
+1. Identify shortcomings and flaws
+2. Check system compatibility (Windows/Linux/Mac)
+3. Suggest specific improvements
+4. Validate assumptions
+5. If input is garbage, REJECT it and explain why
+
+Your output should be the IMPROVED version. If the input is fundamentally flawed, explain why it cannot be refined.
+
+Provide the refined text. Focus on progressive enhancement."""
+
 
 def refine(input_text: str, context: str = "") -> Dict[str, Any]:
     """
@@ -59,7 +78,8 @@ def refine(input_text: str, context: str = "") -> Dict[str, Any]:
         Dictionary with:
             - success (bool)
             - refined_output (str): Final refined text
-            - critiques (list): Critiques from each round
+            - critiques (list): Critiques from each round (round, model,
+              role, output); see critique_preview()
             - rollback_store (obj): For rolling back to previous state
             - error (str): Error if failed
     """
@@ -70,10 +90,10 @@ def refine(input_text: str, context: str = "") -> Dict[str, Any]:
     print_safe(f"Input: {input_text[:100]}...\n")
 
     rounds = REFINEMENT_MODELS["rounds"]
-    current_state = {"original": input_text, "context": context}
+    n_rounds = len(rounds)
 
-    # Save original state for rollback
-    rollback.save_state("refine_session", current_state)
+    # Save original state for rollback; rounds only store what changes
+    rollback.save_session_meta("refine_session", {"original": input_text, "context": context})
 
     critiques = []
     refined_output = input_text
@@ -83,26 +103,10 @@ def refine(input_text: str, context: str = "") -> Dict[str, Any]:
         role = round_config["role"]
         timeout = round_config.get("timeout", 90)
 
-        print_safe(f"[Round {i}/{len(rounds)}] {model} - {role}...")
+        print_safe(f"[Round {i}/{n_rounds}] {model} - {role}...")
 
         # Build prompt for this round
-        prompt = f"""You are a {role}. Your task is to review and refine the following text.
-
-INPUT TO REFINE:
-{refined_output}
-
-{context}
-
-Your CRITICAL REVIEW must:
-1. Identify shortcomings and flaws
-2. Check system compatibility (Windows/Linux/Mac)
-3. Suggest specific improvements
-4. Validate assumptions
-5. If input is garbage, REJECT it and explain why
-
-Your output should be the IMPROVED version. If the input is fundamentally flawed, explain why it cannot be refined.
-
-Provide the refined text. Focus on progressive enhancement."""
+        prompt = _PROMPT_TEMPLATE.format(role=role, refined_output=refined_output, context=context)
 
         # Track start time for dashboard
         call_start = time.time()
@@ -140,8 +144,12 @@ Provide the refined text. Focus on progressive enhancement."""
 
         round_output = result["content"]
 
-        # Quality gate: Check if this round actually refined the input
-        passes, reason = QualityGate.validate_refinement_output(round_output, i)
+        # Quality gate: Check if this round actually refined the input.
+        # A model that echoed its input back is rejected without the full check
+        if round_output == refined_output:
+            passes, reason = False, f"Round {i} output identical to its input"
+        else:
+            passes, reason = QualityGate.validate_refinement_output(round_output, i)
         if not passes:
             print_safe(f"\n⚠ Quality gate failed: {reason}")
             print_safe(f"   Rolling back to previous state...\n")
@@ -159,8 +167,6 @@ Provide the refined text. Focus on progressive enhancement."""
 
         # Save state for potential rollback
         rollback.save_state("refine_session", {
-            "original": input_text,
-            "context": context,
             "round": i,
             "output": round_output,
             "model": model,
@@ -170,8 +176,7 @@ Provide the refined text. Focus on progressive enhancement."""
             "round": i,
             "model": model,
             "role": role,
-            "critique": round_output[:500] if len(round_output) > 500 else round_output,
-            "full_output": round_output,
+            "output": round_output,
         })
 
         refined_output = round_output
@@ -188,6 +193,11 @@ Provide the refined text. Focus on progressive enhancement."""
     }
 
 
+def critique_preview(critique: Dict[str, Any], n: int = 500) -> str:
+    """Short preview of a round's output from refine()'s critiques list."""
+    return critique["output"][:n]
+
+
 def rollback(session_id: str = "refine_session") -> Dict[str, Any]:
     """
     Rollback to a previous state.
@@ -233,6 +243,6 @@ if __name__ == "__main__":
         print("\n=== Critiques ===")
         for c in result["critiques"]:
             print(f"\nRound {c['round']} ({c['model']}):")
-            print(f"  {c['critique'][:200]}...")
+            print(f"  {critique_preview(c, 200)}...")
     else:
         print(f"Error: {result['error']}")
@@ -3,252 +3,28 @@
 Council Review: Metacognition System Phases 0-2
 """
 
+import os
 import sys
-import io
+import asyncio
+import hashlib
+import json
 from pathlib import Path
+from typing import Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 # UTF-8 output for Windows
 if sys.platform == "win32":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
-
-from build_reviewer import quick_review
-
-# Implementation summary
-IMPLEMENTATION_SUMMARY = """
-METACOGNITION SYSTEM PHASES 0-2 - COMPLETE IMPLEMENTATION
-
-STATUS: All 10 mandatory requirements (M1-M10) + R1 validated through automated testing
-
-=============================================================================
-FILES CREATED (15 files, ~2,500 lines of Python code)
-=============================================================================
-
-CORE INFRASTRUCTURE:
-  skills/metacognition/core/config.py
-    - MetacognitionConfig Pydantic model (M10)
-    - Environment variable overrides via env_prefix
-    - Field-level validation with constraints
-
-  skills/metacognition/core/database.py
-    - MetacognitionDB with thread-safe SQLite
-    - _configure_connection() override for WAL mode (M4)
-    - Network path detection for WAL fallback (M9)
-    - Parameterized queries throughout (M3)
-    - get_health_status() returning HealthStatus enum (M7)
-
-  skills/metacognition/core/buffer.py
-    - AsyncTelemetryBuffer with asyncio.Queue (M1)
-    - Dual thresholds: 5000 items, 50MB memory (M2)
-    - 1-second timeout on buffer operations
-
-  skills/metacognition/core/hooks.py
-    - SystemContext context manager (M5)
-    - RedactionEngine with PII regex patterns (M6)
-    - Telemetry capture with monotonic time (M8)
-    - Recursive hook prevention
-
-  skills/metacognition/core/consumer.py
-    - AsyncMetacognitionConsumer worker (M1)
-    - CircuitBreaker for resilience (R1)
-    - Parameterized batch insert (M3)
-
-ANALYSIS ENGINE:
-  skills/metacognition/core/evaluators/drift_score.py
-    - calculate_drift_score() using time.monotonic() (M8)
-    - Weighted combination: 0.6 * success_diff + 0.4 * duration_drift
-
-  skills/metacognition/core/evaluators/loop_detector.py
-    - LoopDetector with sliding window
-    - Monotonic optimization detection
-    - Flagged metrics reporting
-
-  skills/metacognition/core/monitor.py
-    - MetacognitionMonitor with HealthStatus (M7)
-    - SystemContext for recursive prevention (M5)
-    - Circuit breaker integration (R1)
-    - Knowledge graph updates
-
-  skills/metacognition/core/retention.py
-    - prune_old_telemetry() with retention policy
-    - Incremental vacuum for space reclamation
-
-DATABASE & TESTS:
-  skills/metacognition/migrations/0001_initial.sql
-    - Schema: sessions, session_metrics, kg_nodes, kg_edges
-    - Proper indexes and constraints
-
-  skills/metacognition/tests/test_phase0.py
-    - Phase 0 unit tests (all passed)
-
-  skills/metacognition/tests/integration_test.py
-    - Full integration test validating all M1-M10, R1
-    - All 11 requirements PASSED
-
-=============================================================================
-ARCHITECTURE
-=============================================================================
-
-Agent Execution Pipeline
-  → Tool Execution Callback
-  → Metacognition Sidecar (Async observer - never in critical path)
-    ├── Telemetry Layer (Hooks → Async Buffer → Database)
-    ├── Analysis Engine (Drift, KG, Loop Detection)
-    └── Health Monitoring (Circuit Breaker, HealthStatus)
-
-Database: ~/.claude/metacognition.db (SQLite with WAL mode)
-Separate DB prevents lock contention with main operations
-
-=============================================================================
-REQUIREMENTS VALIDATION
-=============================================================================
-
-M1: Async operations (non-blocking) ✓
-  - AsyncTelemetryBuffer uses asyncio.Queue
-  - AsyncMetacognitionConsumer processes events asynchronously
-  - 1-second timeout prevents blocking
-
-M2: Dual thresholds (5000 items, 50MB memory) ✓
-  - buffer_max_items = 5000 (configurable)
-  - buffer_max_memory_mb = 50 (configurable)
-  - Both enforced before enqueue
-
-M3: Parameterized queries for SQL ✓
-  - All SQL uses ? placeholders
-  - cursor.execute(), cursor.executemany() with parameter tuples
-  - No string interpolation in queries
-
-M4: _configure_connection() override for WAL ✓
-  - Override method in MetacognitionDB class
-  - WAL mode configured via override (not constructor)
-  - Network path detection for fallback
-
-M5: SystemContext for recursive prevention ✓
-  - SystemContext context manager for system operations
-  - is_system_operation() check in telemetry hooks
-  - Prevents recursive hook invocation
-
-M6: RedactionEngine PII scrubbing ✓
-  - RedactionEngine class with regex patterns
-  - Scrubs API keys, tokens, passwords, user paths, emails
-  - Applied before persistence
-
-M7: get_health_status() returning HealthStatus enum ✓
-  - Implemented in MetacognitionDB and MetacognitionMonitor
-  - Returns "HEALTHY", "DEGRADED", or "UNHEALTHY"
-  - Validates circuit breaker, staleness, loop alerts
-
-M8: time.monotonic() for durations ✓
-  - duration_mono field stores monotonic time values
-  - Drift score calculation uses monotonic durations
-  - Hooks capture time.monotonic() at start of operations
-
-M9: Network path detection for WAL fallback ✓
-  - _is_network_path() method in MetacognitionDB
-  - Detects UNC paths (\\\\server\\share) and mapped drives (H-Z)
-  - Disables WAL mode for network paths
-
-M10: MetacognitionConfig Pydantic model ✓
-  - Pydantic BaseModel with validation
-  - Environment variable overrides via env_prefix
-  - Field-level validation with constraints
-
-R1: Circuit breaker for resilience ✓
-  - CircuitBreaker class with state management
-  - Failure threshold and recovery timeout
-  - Integrated into consumer and monitor
-
-=============================================================================
-SECURITY CONSIDERATIONS
-=============================================================================
-
-SQL Injection Prevention:
-  - All queries use parameterized statements (? placeholders)
-  - No string concatenation in SQL queries
-
-PII Protection:
-  - RedactionEngine scrubs sensitive data before persistence
-  - Patterns cover: API keys, tokens, passwords, user paths, emails
-
-Path Handling:
-  - Network path detection for WAL fallback
-  - Proper handling of UNC paths and mapped drives
-  - Cross-platform path handling
-
-Recursive Prevention:
-  - SystemContext prevents infinite hook recursion
-  - is_system_operation() check before telemetry capture
-
-=============================================================================
-INTEGRATION TEST RESULTS
-=============================================================================
-
-======================================================================
-METACOGNITION SYSTEM PHASES 0-2: INTEGRATION TEST
-======================================================================
-
-[M10] MetacognitionConfig (Pydantic)............ PASSED
-[M4, M9] MetacognitionDB (_configure_connection).... PASSED
-[M3] Parameterized queries....................... PASSED
-[M7] get_health_status()...................... PASSED
-[M1, M2] AsyncTelemetryBuffer (dual thresholds)... PASSED
-[M5] SystemContext for recursive prevention.... PASSED
-[M6] RedactionEngine PII scrubbing............. PASSED
-[M8] time.monotonic() for durations............ PASSED
-[R1] Circuit breaker for resilience............ PASSED
-
-=== ALL REQUIREMENTS VALIDATED ===
-
-=============================================================================
-NEXT STEPS (Phases 3-6)
-=============================================================================
-
-Phase 3: Context Injector
-  - Advisory recommendations (not self-applying yet)
-  - 100ms timeout for context injection
-  - Integration with tool selection
-
-Phase 4: Dashboard
-  - CLI interface for metrics viewing
-  - Web visualization (optional)
-  - Authentication for dashboard access
-  - Metrics export (Prometheus, JSON)
-
-Phase 5: Shadow Mode
-  - 100+ sessions for validation
-  - 85%+ accuracy requirement
-  - A/B testing framework
-  - Human-in-the-loop review
-
-Phase 6: Self-Applying
-  - Conditional self-application
-  - Human approval required
-  - Rollback capability
-  - Immutable Constitution enforcement
-
-=============================================================================
-KNOWN LIMITATIONS
-=============================================================================
-
-1. No existing infrastructure inheritance - Built standalone components
-   per actual codebase (no SingletonDB, TelemetryBuffer, HookRegistry found)
-
-2. Hook registration not implemented - Telemetry capture needs integration
-   point with actual tool execution (requires Claude Code plugin integration)
-
-3. Manual testing - No automated test runner yet (tests run manually)
-
-4. Dashboard not implemented - Scheduled for Phase 4
-
-5. Shadow mode not implemented - Scheduled for Phase 5
-
-=============================================================================
-"""
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+from build_reviewer import quick_review_async
 
-# Review criteria matching M1-M10, R1
-CRITERIA = [
+# Implementation summary, kept next to this script and read when the review runs
+SUMMARY_PATH = Path(__file__).parent / "review_metacognition_summary.txt"
+
+# Review criteria matching M1-M10, R1 (read-only, interned for cache keys)
+CRITERIA = tuple(sys.intern(c) for c in (
     "M1: Async operations (non-blocking) - asyncio.Queue, async worker, 1s timeout",
     "M2: Dual thresholds (5000 items, 50MB memory) - configurable limits enforced",
     "M3: Parameterized queries for SQL - all queries use ? placeholders, no injection risk",
@@ -263,61 +39,206 @@ CRITERIA = [
     "Security: No SQL injection vectors - parameterized queries throughout",
     "Security: PI redaction before persistence - sensitive data scrubbed",
     "Architecture: Sidecar pattern - never in critical path, async observer",
-    "Testing: All requirements validated through unit + integration tests"
-]
+    "Testing: All requirements validated through unit + integration tests",
+))
+
+# Criteria are reviewed in independent groups, concurrently
+CRITERIA_GROUPS = (CRITERIA[:5], CRITERIA[5:10], CRITERIA[10:])
+
+# Criteria encoded once, for hashing into the cache key
+CRITERIA_BLOB = "\n".join(CRITERIA).encode("utf-8")
+
+
+# Report separators
+SEP_EQ = "=" * 70
+SEP_DASH = "-" * 70
+
+# Characters per write when printing the full review
+WRITE_CHUNK = 8192
+
+# Reviews of unchanged input are reused from here (skip with --no-cache)
+CACHE_DIR = Path.home() / ".cache" / "council"
+
+# Source tree under review; a cached verdict is only reused while it is
+# unchanged (project root is four levels up, or as far up as the path goes)
+_SCRIPT_PARENTS = Path(__file__).resolve().parents
+SOURCE_DIR = _SCRIPT_PARENTS[min(3, len(_SCRIPT_PARENTS) - 1)] / "skills" / "metacognition"
+
+
+def review_cache_path(summary: str, criteria_blob: bytes) -> Path:
+    """Cache file for the review of this summary against these criteria."""
+    h = hashlib.blake2b(summary.encode("utf-8"), digest_size=16)
+    h.update(b"\0")
+    h.update(criteria_blob)
+    key = h.hexdigest()
+    return CACHE_DIR / f"review_{key}.json"
+
+
+def source_mtime() -> Optional[float]:
+    """Newest mtime of the .py files under SOURCE_DIR (None if there are none)."""
+    if not SOURCE_DIR.is_dir():
+        return None
+    return max((p.stat().st_mtime for p in SOURCE_DIR.rglob("*.py")), default=None)
+
+
+def stdout_pipe_fd():
+    """Return fd 1 when stdout is a pipe or file rather than a console, else None."""
+    try:
+        if sys.stdout.fileno() == 1 and not sys.stdout.isatty():
+            return 1
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
+
+
+def write_fd(fd: int, data: bytes):
+    """Write all of data to fd, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+# Merged verdict is the worst of the group verdicts
+VERDICT_RANK = {"APPROVED": 0, "CONDITIONAL": 1, "UNKNOWN": 2, "REJECTED": 3}
+
+
+def merge_reviews(results) -> dict:
+    """
+    Combine the per-group review results (in CRITERIA_GROUPS order) into one.
+
+    If any group failed, the merged result is unsuccessful and its error
+    names each failed group, but the checks of the groups that did succeed
+    are still merged in.
+    """
+    ok = [r for r in results if r["success"]]
+    errors = []
+    first = 1
+    for group, r in zip(CRITERIA_GROUPS, results):
+        last = first + len(group) - 1
+        if not r["success"]:
+            errors.append(f"criteria {first}-{last}: {r.get('error') or 'Unknown error'}")
+        first = last + 1
+
+    verdicts = [r["recommendation"] for r in ok]
+    return {
+        "success": not errors,
+        "review_reports": [r["review_report"] for r in ok],
+        "passed_checks": [c for r in ok for c in r["passed_checks"]],
+        "failed_checks": [c for r in ok for c in r["failed_checks"]],
+        "warnings": [w for r in ok for w in r["warnings"]],
+        "recommendation": max(verdicts, key=lambda v: VERDICT_RANK.get(v, 2)) if verdicts else "UNKNOWN",
+        "full_review": "\n\n".join(r["full_review"] for r in ok),
+        "error": "; ".join(errors) or None,
+    }
+
+
+async def review_groups(summary: str) -> dict:
+    """Review every criteria group at once and merge the results."""
+    results = await asyncio.gather(
+        *(quick_review_async(summary, list(group)) for group in CRITERIA_GROUPS)
+    )
+    return merge_reviews(results)
 
 
 def main():
-    print("=" * 70)
+    print(SEP_EQ)
     print("COUNCIL BUILD REVIEWER: METACOGNITION PHASES 0-2")
-    print("=" * 70)
+    print(SEP_EQ)
     print()
 
-    result = quick_review(
-        what_was_built=IMPLEMENTATION_SUMMARY,
-        criteria=CRITERIA
-    )
-
-    if result["success"]:
-        print()
-        print("=" * 70)
-        print("REVIEW RESULTS")
-        print("=" * 70)
-        print()
-        print(f"VERDICT: {result['recommendation']}")
-        print()
-
-        if result.get('passed_checks'):
-            print("PASSED CHECKS:")
-            for check in result['passed_checks']:
-                print(f"  ✓ {check}")
-            print()
-
-        if result.get('failed_checks'):
-            print("FAILED CHECKS:")
-            for check in result['failed_checks']:
-                print(f"  ✗ {check}")
-            print()
-
-        if result.get('warnings'):
-            print("WARNINGS:")
-            for warning in result['warnings']:
-                print(f"  ⚠ {warning}")
-            print()
-
-        print("=" * 70)
+    summary = SUMMARY_PATH.read_text(encoding="utf-8")
+    use_cache = "--no-cache" not in sys.argv[1:]
+    cache = review_cache_path(summary, CRITERIA_BLOB)
+    src_mtime = source_mtime()
+    if use_cache and src_mtime is None:
+        # Without the sources there is nothing to tell a stale verdict apart
+        print(f"(no sources under {SOURCE_DIR}; review cache disabled)", file=sys.stderr)
+        use_cache = False
+
+    cached = None
+    if use_cache and cache.exists():
+        cached = json.loads(cache.read_bytes())
+        if cached.get("src_mtime") != src_mtime:
+            cached = None
+
+    if cached is not None:
+        result = cached["result"]
+        print(f"(cached review: {cache.name})")
+    else:
+        result = asyncio.run(review_groups(summary))
+        if use_cache and result["success"]:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            cache.write_text(
+                json.dumps({"src_mtime": src_mtime, "result": result}),
+                encoding="utf-8",
+            )
+
+    # A partial review (some groups failed) is still shown, but exits 1
+    status = 0 if result["success"] else 1
+    if result["success"] or result.get("review_reports"):
+        passed_checks = result.get('passed_checks') or ()
+        failed_checks = result.get('failed_checks') or ()
+        warnings = result.get('warnings') or ()
+        full_review = result.get('full_review')
+
+        # Collect the report and write it in one call
+        out = ["", SEP_EQ, "REVIEW RESULTS", SEP_EQ, ""]
+        out.append(f"VERDICT: {result['recommendation']}")
+        out.append("")
+        if not result["success"]:
+            out.append(f"INCOMPLETE (failed: {result['error']})")
+            out.append("")
+
+        if passed_checks:
+            out.append("PASSED CHECKS:")
+            for check in passed_checks:
+                out.append(f"  ✓ {check}")
+            out.append("")
+
+        if failed_checks:
+            out.append("FAILED CHECKS:")
+            for check in failed_checks:
+                out.append(f"  ✗ {check}")
+            out.append("")
+
+        if warnings:
+            out.append("WARNINGS:")
+            for warning in warnings:
+                out.append(f"  ⚠ {warning}")
+            out.append("")
+
+        out.append(SEP_EQ)
 
         # Show full review if available
-        if result.get('full_review'):
-            print()
-            print("FULL REVIEW:")
-            print("-" * 70)
-            print(result['full_review'])
+        if full_review:
+            out.append("")
+            out.append("FULL REVIEW:")
+            out.append(SEP_DASH)
+
+        fd = stdout_pipe_fd()
+        if fd is not None:
+            # Piped output (e.g. into tee): encode the whole report once and
+            # hand it straight to the fd, skipping the text layer
+            if full_review:
+                out.append(full_review)
+            sys.stdout.flush()
+            write_fd(fd, ("\n".join(out) + "\n").encode("utf-8"))
+            return status
+
+        sys.stdout.write("\n".join(out) + "\n")
+
+        if full_review:
+            # Long model output goes out in chunks: Windows consoles stall
+            # or truncate on very large single writes
+            for i in range(0, len(full_review), WRITE_CHUNK):
+                sys.stdout.write(full_review[i:i + WRITE_CHUNK])
+            sys.stdout.write("\n")
+            sys.stdout.flush()
     else:
         print(f"REVIEW FAILED: {result.get('error', 'Unknown error')}")
         return 1
 
-    return 0
+    return status
 
 
 if __name__ == "__main__":
@@ -21,53 +21,76 @@ Usage:
     python skill.py team-debate <topic>
 
 OUTPUT SAVING: All 7 modes save their output to skills/council/build-plans/
+(pass --no-save to skip it; build-plan always saves its plan)
 Version: 2.1.1 (Priority 1 fix complete - all modes now save output)
 """
 
+import os
 import sys
-import json
+from datetime import datetime
 from pathlib import Path
 
 # Bootstrap: Add project root to sys.path for absolute imports
 # This allows skill.py to be run directly or imported
 project_root = Path(__file__).parent.parent.parent.parent
-if str(project_root) not in sys.path:
+# Compare normalized entries, so the same directory spelled differently
+# ("a/../b", a trailing slash, other case on Windows) is not added twice
+_project_root_norm = os.path.normcase(os.path.abspath(project_root))
+if not any(os.path.normcase(os.path.abspath(p)) == _project_root_norm for p in sys.path):
     sys.path.insert(0, str(project_root))
 
 # Now we can use absolute imports
 scripts_dir = Path(__file__).parent
 
-# Import Council modules
-try:
-    from brainstorm import brainstorm
-    from build_planner import build_planner
-    from build_reviewer import review_build
-    from opus_gatekeeper import OpusGatekeeper
-    from parallel_executor import DiamondOrchestrator
-except ImportError as e:
-    print(f"Error importing Council modules: {e}", file=sys.stderr)
-    sys.exit(1)
+# Council modules (paths included) are imported by the code that uses them,
+# so a run only loads what its mode needs and usage works on its own
+
+
+# Banner titles per mode
+_BANNERS = {
+    "brainstorm": "⚡ Council Brainstorming Mode",
+    "refine": "🔍 Council Refinement Mode",
+    "build-plan": "🏗️  Council Build Planning Mode",
+    "build-review": "✅ Council Build Reviewer Mode",
+    "opus-gatekeeper": "🚪 Council Opus Gatekeeper Mode",
+    "diamond-debate": "💎 Council Diamond Debate Mode",
+    "team-debate": "🏛️  Council Team Debate Mode"
+}
+
+# Section separators for console output
+_EQ60 = "=" * 60
+_DASH60 = "─" * 60
 
 
 def print_banner(mode: str):
     """Print Council banner for mode."""
-    banners = {
-        "brainstorm": "⚡ Council Brainstorming Mode",
-        "refine": "🔍 Council Refinement Mode",
-        "build-plan": "🏗️  Council Build Planning Mode",
-        "build-review": "✅ Council Build Reviewer Mode",
-        "opus-gatekeeper": "🚪 Council Opus Gatekeeper Mode",
-        "diamond-debate": "💎 Council Diamond Debate Mode",
-        "team-debate": "🏛️  Council Team Debate Mode"
-    }
-    print(f"\n{banners.get(mode, 'Council Mode')}")
-    print("=" * 60)
+    print(f"\n{_BANNERS.get(mode, 'Council Mode')}\n{_EQ60}")
 
 
 # =============================================================================
 # COUNCIL OUTPUT SAVING (Priority 1 Fix)
 # =============================================================================
 
+def _file_timestamp(now: datetime) -> str:
+    """Filename timestamp, YYYYmmdd-HHMMSS (built directly instead of via strftime)."""
+    return f"{now.year:04d}{now.month:02d}{now.day:02d}-{now.hour:02d}{now.minute:02d}{now.second:02d}"
+
+
+# Flags for one-shot artifact writes (O_BINARY only exists on Windows)
+_ARTIFACT_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_artifact(path: str, text: str):
+    """Write a whole artifact straight to a file descriptor (encoded once, no io layers)."""
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, _ARTIFACT_FLAGS, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
 def save_council_output(mode: str, content: str, prompt_summary: str = "") -> str:
     """
     Save Council output to build-plans/ directory.
@@ -83,23 +106,23 @@ def save_council_output(mode: str, content: str, prompt_summary: str = "") -> st
         Path to saved file, or None if save failed
     """
     try:
-        from paths import get_build_plans_dir, sanitize_filename, ensure_directories
-        from datetime import datetime
+        from paths import get_build_plans_dir_str, sanitize_filename, ensure_directories
 
         ensure_directories()
 
         # Create filename: timestamp-mode-summary.md
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        now = datetime.now()
+        timestamp = _file_timestamp(now)
         # Sanitize summary for filename (limit to 40 chars, remove special chars)
         safe_summary = sanitize_filename(prompt_summary[:40] if prompt_summary else "output")
         filename = f"{timestamp}-{mode}-{safe_summary}.md"
 
-        artifact_path = get_build_plans_dir() / filename
+        artifact_path = os.path.join(get_build_plans_dir_str(), filename)
 
         # Add header to content
         full_content = f"""# Council {mode.title()} Output
 
-**Generated:** {datetime.now().isoformat()}
+**Generated:** {now.isoformat()}
 **Mode:** {mode}
 **Prompt:** {prompt_summary[:100] if prompt_summary else 'N/A'}
 
@@ -109,21 +132,27 @@ def save_council_output(mode: str, content: str, prompt_summary: str = "") -> st
 """
 
         # Write to file
-        artifact_path.write_text(full_content, encoding="utf-8")
+        _write_artifact(artifact_path, full_content)
 
-        print(f"\n✓ Council {mode} output saved to: {artifact_path.name}")
-        return str(artifact_path)
+        print(f"\n✓ Council {mode} output saved to: {filename}")
+        return artifact_path
 
     except Exception as e:
         print(f"\n⚠ Warning: Could not save {mode} output: {e}", file=sys.stderr)
         return None
 
 
-def mode_brainstorm(prompt: str, max_ideas: int = 10):
+def mode_brainstorm(prompt: str, max_ideas: int = 10, save: bool = True):
     """Run brainstorming mode."""
     print_banner("brainstorm")
     print(f"Prompt: {prompt[:100]}...\n")
 
+    try:
+        from brainstorm import brainstorm
+    except ImportError as e:
+        print(f"Error importing Council modules: {e}", file=sys.stderr)
+        return 1
+
     result = brainstorm(prompt, max_ideas=max_ideas)
 
     if result["success"]:
@@ -133,14 +162,15 @@ def mode_brainstorm(prompt: str, max_ideas: int = 10):
             desc = idea["description"][:200]
             print(f"{i}. [{category}] {desc}...")
 
-        # Save output
-        output_content = f"Generated {result['count']} ideas:\n\n"
-        for i, idea in enumerate(result["ideas"], 1):
-            category = idea.get("category", "General")
-            desc = idea["description"]
-            output_content += f"{i}. [{category}] {desc}\n"
+        if save:
+            # Save output
+            parts = [f"Generated {result['count']} ideas:\n\n"]
+            for i, idea in enumerate(result["ideas"], 1):
+                category = idea.get("category", "General")
+                desc = idea["description"]
+                parts.append(f"{i}. [{category}] {desc}\n")
 
-        save_council_output("brainstorm", output_content, prompt)
+            save_council_output("brainstorm", "".join(parts), prompt)
 
         return 0
     else:
@@ -148,35 +178,44 @@ def mode_brainstorm(prompt: str, max_ideas: int = 10):
         return 1
 
 
-def mode_refine(input_text: str, context: str = ""):
+def mode_refine(input_text: str, context: str = "", save: bool = True):
     """Run refinement mode."""
     print_banner("refine")
     print(f"Input: {input_text[:100]}...\n")
 
     # Import refine module
     try:
-        from refine import refine
+        from refine import refine, critique_preview
         result = refine(input_text, context=context)
 
         if result["success"]:
             print("\n✓ Refinement complete:\n")
             print(result["refined_output"][:500] + "...")
 
-            if result.get("critiques"):
+            # One pass over the critiques for both the console and the saved output
+            critiques = result.get("critiques") or ()
+            print_lines = []
+            md_lines = []
+            for critique in critiques:
+                model = critique.get("model", "Unknown")
+                print_lines.append(f"  - {model}: {critique_preview(critique, 200)}\n")
+                if save:
+                    md_lines.append(f"- {model}: {critique_preview(critique)}\n")
+
+            if critiques:
                 print("\nCritiques:")
-                for critique in result["critiques"]:
-                    print(f"  - {critique.get('model', 'Unknown')}: {critique.get('summary', 'No summary')}")
+                sys.stdout.write("".join(print_lines))
 
-            # Save output
-            output_content = f"Input: {input_text[:200]}...\n\n"
-            output_content += f"Refined Output:\n{result['refined_output']}\n\n"
+            if save:
+                # Save output
+                parts = [f"Input: {input_text[:200]}...\n\n"]
+                parts.append(f"Refined Output:\n{result['refined_output']}\n\n")
 
-            if result.get("critiques"):
-                output_content += "Critiques:\n"
-                for critique in result.get("critiques", []):
-                    output_content += f"- {critique.get('model', 'Unknown')}: {critique.get('summary', 'No summary')}\n"
+                if critiques:
+                    parts.append("Critiques:\n")
+                    parts.extend(md_lines)
 
-            save_council_output("refine", output_content, input_text[:40])
+                save_council_output("refine", "".join(parts), input_text[:40])
 
             return 0
         else:
@@ -187,11 +226,17 @@ def mode_refine(input_text: str, context: str = ""):
         return 1
 
 
-def mode_build_plan(topic: str, context: str = ""):
-    """Run build planning mode."""
+def mode_build_plan(topic: str, context: str = "", save: bool = True):
+    """Run build planning mode (the plan artifact is its result and is always saved)."""
     print_banner("build-plan")
     print(f"Topic: {topic[:100]}...\n")
 
+    try:
+        from build_planner import build_planner
+    except ImportError as e:
+        print(f"Error importing Council modules: {e}", file=sys.stderr)
+        return 1
+
     result = build_planner(topic, context=context)
 
     if result["success"]:
@@ -213,11 +258,17 @@ def mode_build_plan(topic: str, context: str = ""):
         return 1
 
 
-def mode_build_review(implementation_summary: str, build_plan_path: str = None):
+def mode_build_review(implementation_summary: str, build_plan_path: str = None, save: bool = True):
     """Run build review mode."""
     print_banner("build-review")
     print(f"Reviewing implementation...\n")
 
+    try:
+        from build_reviewer import review_build, quick_review
+    except ImportError as e:
+        print(f"Error importing Council modules: {e}", file=sys.stderr)
+        return 1
+
     if build_plan_path:
         # Review against build plan
         result = review_build(
@@ -226,7 +277,6 @@ def mode_build_review(implementation_summary: str, build_plan_path: str = None):
         )
     else:
         # Quick review without plan
-        from build_reviewer import quick_review
         result = quick_review(
             what_was_built=implementation_summary,
             criteria=[
@@ -238,31 +288,34 @@ def mode_build_review(implementation_summary: str, build_plan_path: str = None):
         )
 
     if result["success"]:
+        passed = result.get("passed_checks") or ()
+        failed = result.get("failed_checks") or ()
         print(f"\n✓ Verdict: {result['recommendation']}")
 
-        # Save output to build-plans/ (not build-reviews/)
-        output_content = f"Verdict: {result['recommendation']}\n\n"
+        if save:
+            # Save output to build-plans/ (not build-reviews/)
+            parts = [f"Verdict: {result['recommendation']}\n\n"]
 
-        if result.get("passed_checks"):
-            output_content += "Passed Checks:\n"
-            for check in result.get("passed_checks", []):
-                output_content += f"  ✓ {check}\n"
+            if passed:
+                parts.append("Passed Checks:\n")
+                for check in passed:
+                    parts.append(f"  ✓ {check}\n")
 
-        if result.get("failed_checks"):
-            output_content += "Failed Checks:\n"
-            for check in result.get("failed_checks", []):
-                output_content += f"  ✗ {check}\n"
+            if failed:
+                parts.append("Failed Checks:\n")
+                for check in failed:
+                    parts.append(f"  ✗ {check}\n")
 
-        save_council_output("build-review", output_content, implementation_summary[:40])
+            save_council_output("build-review", "".join(parts), implementation_summary[:40])
 
-        if result.get("passed_checks"):
-            print(f"\nPassed ({len(result['passed_checks'])}):")
-            for check in result["passed_checks"][:3]:
+        if passed:
+            print(f"\nPassed ({len(passed)}):")
+            for check in passed[:3]:
                 print(f"  ✓ {check}")
 
-        if result.get("failed_checks"):
-            print(f"\nFailed ({len(result['failed_checks'])}):")
-            for check in result["failed_checks"][:3]:
+        if failed:
+            print(f"\nFailed ({len(failed)}):")
+            for check in failed[:3]:
                 print(f"  ✗ {check}")
         return 0
     else:
@@ -270,11 +323,17 @@ def mode_build_review(implementation_summary: str, build_plan_path: str = None):
         return 1
 
 
-def mode_opus_gatekeeper(query: str, monthly_budget: float = 100.0, current_spend: float = 0.0):
+def mode_opus_gatekeeper(query: str, monthly_budget: float = 100.0, current_spend: float = 0.0, save: bool = True):
     """Run Opus gatekeeper mode."""
     print_banner("opus-gatekeeper")
     print(f"Query: {query[:100]}...\n")
 
+    try:
+        from opus_gatekeeper import OpusGatekeeper, OpusDecision
+    except ImportError as e:
+        print(f"Error importing Council modules: {e}", file=sys.stderr)
+        return 1
+
     gatekeeper = OpusGatekeeper(
         monthly_budget=monthly_budget,
         current_monthly_spend=current_spend
@@ -282,41 +341,42 @@ def mode_opus_gatekeeper(query: str, monthly_budget: float = 100.0, current_spen
 
     result = gatekeeper.should_invoke_opus(query)
 
-    print(f"Decision: {result.decision.value}")
+    print(f"Decision: {result.decision.name}")
     print(f"Category: {result.category}")
     print(f"Tier: {result.tier}")
     print(f"Confidence: {result.confidence:.0%}")
     print(f"Reason: {result.reason}")
     print(f"Budget Remaining: ${result.budget_remaining:.2f} / ${monthly_budget:.2f}")
 
-    if result.decision.value != "INVOKE":
+    if result.decision != OpusDecision.INVOKE:
         alternative = gatekeeper.recommend_degradation(result)
         if alternative:
             print(f"\n→ Recommended Alternative: {alternative}")
         else:
             print(f"\n→ No alternative needed (skip Opus)")
 
-    # Save output
-    output_content = f"""Decision: {result.decision.value}
+    if save:
+        # Save output
+        parts = [f"""Decision: {result.decision.name}
 Category: {result.category}
 Tier: {result.tier}
 Confidence: {result.confidence:.0%}
 Reason: {result.reason}
 Budget Remaining: ${result.budget_remaining:.2f} / ${monthly_budget:.2f}
-"""
-    if result.decision.value != "INVOKE":
-        alternative = gatekeeper.recommend_degradation(result)
-        if alternative:
-            output_content += f"\nRecommended Alternative: {alternative}\n"
-        else:
-            output_content += "\nNo alternative needed (skip Opus)\n"
+"""]
+        if result.decision != OpusDecision.INVOKE:
+            alternative = gatekeeper.recommend_degradation(result)
+            if alternative:
+                parts.append(f"\nRecommended Alternative: {alternative}\n")
+            else:
+                parts.append("\nNo alternative needed (skip Opus)\n")
 
-    save_council_output("opus-gatekeeper", output_content, query[:40])
+        save_council_output("opus-gatekeeper", "".join(parts), query[:40])
 
-    return 0 if result.decision.value in ["INVOKE", "SKIP"] else 1
+    return 0 if result.decision != OpusDecision.BUDGET_BLOCK else 1
 
 
-def mode_diamond_debate(topic: str, focus: str = "", context: str = ""):
+def mode_diamond_debate(topic: str, focus: str = "", context: str = "", save: bool = True):
     """
     Run Diamond Debate mode using Diamond Architecture (parallel stages).
 
@@ -332,81 +392,94 @@ def mode_diamond_debate(topic: str, focus: str = "", context: str = ""):
         print(f"Focus: {focus}")
     print()
 
-    orchestrator = DiamondOrchestrator()
+    try:
+        from parallel_executor import DiamondOrchestrator
+    except ImportError as e:
+        print(f"Error importing Council modules: {e}", file=sys.stderr)
+        return 1
 
     # Build context string
     full_context = f"Focus: {focus}\n\n{context}" if focus else context
 
     # Execute Diamond Architecture
-    result = orchestrator.execute_diamond(
-        query=topic,
-        context=full_context,
-        invoke_opus=True,  # Always invoke Opus for final ratification
-        opus_threshold="conditional"
-    )
+    with DiamondOrchestrator() as orchestrator:
+        result = orchestrator.execute_diamond(
+            query=topic,
+            context=full_context,
+            invoke_opus=True,  # Always invoke Opus for final ratification
+            opus_threshold="conditional"
+        )
+
+    # Look up each stage once for both the display and the saved output
+    stages = result["stages"]
+    stage1 = stages.get("context")
+    stage2 = stages.get("deliberation")
+    stage3 = stages.get("synthesis")
+    stage4 = stages.get("ratification")
+    s1_resps = stage1.get_successful_responses() if stage1 else []
+    s2_resps = stage2.get_successful_responses() if stage2 else []
+    synthesis = stage3.get_model_content("gemini-pro") if stage3 else None
+    decree = stage4.get_model_content("opus-synthesis") if stage4 else None
 
     # Display results
-    print(f"\n{'='*60}")
-    print("💎 DIAMOND DEBATE RESULTS")
-    print(f"{'='*60}\n")
+    lines = []
+    lines.append(f"\n{_EQ60}")
+    lines.append("💎 DIAMOND DEBATE RESULTS")
+    lines.append(f"{_EQ60}\n")
 
     # Stage 1: Context Acquisition
-    stage1 = result["stages"].get("context")
     if stage1:
-        print("1️⃣  Stage 1: Context Acquisition (Parallel)")
-        print(f"   Models: kimi-researcher + perplexity-online")
-        print(f"   Time: {stage1.total_latency:.2f}s | Cost: ${stage1.total_cost:.4f}")
-        print(f"   Success: {stage1.success_count}/{len(stage1.responses)}")
-        for response in stage1.get_successful_responses():
+        lines.append("1️⃣  Stage 1: Context Acquisition (Parallel)")
+        lines.append(f"   Models: kimi-researcher + perplexity-online")
+        lines.append(f"   Time: {stage1.total_latency:.2f}s | Cost: ${stage1.total_cost:.4f}")
+        lines.append(f"   Success: {stage1.success_count}/{len(stage1.responses)}")
+        for response in s1_resps:
             preview = response.content[:150].replace('\n', ' ')
-            print(f"\n   📌 {response.model}:")
-            print(f"      {preview}...")
+            lines.append(f"\n   📌 {response.model}:")
+            lines.append(f"      {preview}...")
 
     # Stage 2: Deliberation
-    stage2 = result["stages"].get("deliberation")
     if stage2:
-        print(f"\n2️⃣  Stage 2: Deliberation (Parallel)")
-        print(f"   Models: deepseek-v3 + gemini-flash + claude-sonnet")
-        print(f"   Time: {stage2.total_latency:.2f}s | Cost: ${stage2.total_cost:.4f}")
-        print(f"   Success: {stage2.success_count}/{len(stage2.responses)}")
-        for response in stage2.get_successful_responses():
+        lines.append(f"\n2️⃣  Stage 2: Deliberation (Parallel)")
+        lines.append(f"   Models: deepseek-v3 + gemini-flash + claude-sonnet")
+        lines.append(f"   Time: {stage2.total_latency:.2f}s | Cost: ${stage2.total_cost:.4f}")
+        lines.append(f"   Success: {stage2.success_count}/{len(stage2.responses)}")
+        for response in s2_resps:
             preview = response.content[:150].replace('\n', ' ')
-            print(f"\n   📌 {response.model}:")
-            print(f"      {preview}...")
+            lines.append(f"\n   📌 {response.model}:")
+            lines.append(f"      {preview}...")
 
     # Stage 3: Synthesis
-    stage3 = result["stages"].get("synthesis")
     if stage3:
-        synthesis = stage3.get_model_content("gemini-pro")
-        print(f"\n3️⃣  Stage 3: Semi-Final Synthesis (gemini-pro)")
-        print(f"   Time: {stage3.total_latency:.2f}s | Cost: ${stage3.total_cost:.4f}")
+        lines.append(f"\n3️⃣  Stage 3: Semi-Final Synthesis (gemini-pro)")
+        lines.append(f"   Time: {stage3.total_latency:.2f}s | Cost: ${stage3.total_cost:.4f}")
         if synthesis:
             preview = synthesis[:300].replace('\n', ' ')
-            print(f"\n   {preview}...")
+            lines.append(f"\n   {preview}...")
 
     # Stage 4: Opus Ratification
-    stage4 = result["stages"].get("ratification")
     if stage4:
-        decree = stage4.get_model_content("opus-synthesis")
-        print(f"\n4️⃣  Stage 4: Final Ratification (opus-synthesis)")
-        print(f"   Time: {stage4.total_latency:.2f}s | Cost: ${stage4.total_cost:.4f}")
+        lines.append(f"\n4️⃣  Stage 4: Final Ratification (opus-synthesis)")
+        lines.append(f"   Time: {stage4.total_latency:.2f}s | Cost: ${stage4.total_cost:.4f}")
         if decree:
-            print(f"\n{'─'*60}")
-            print("🏛️  FINAL COUNCIL DECREE")
-            print(f"{'─'*60}")
-            print(decree)
+            lines.append(f"\n{_DASH60}")
+            lines.append("🏛️  FINAL COUNCIL DECREE")
+            lines.append(_DASH60)
+            lines.append(decree)
 
     # Summary
-    print(f"\n{'='*60}")
-    print("SUMMARY")
-    print(f"{'='*60}")
-    print(f"Total Time: {result['total_latency']:.2f}s")
-    print(f"Total Cost: ${result['total_cost']:.4f}")
-    print(f"Recommendation: {result['final_recommendation']}")
-    print()
-
-    # Save output
-    output_content = f"""Total Time: {result['total_latency']:.2f}s
+    lines.append(f"\n{_EQ60}")
+    lines.append("SUMMARY")
+    lines.append(_EQ60)
+    lines.append(f"Total Time: {result['total_latency']:.2f}s")
+    lines.append(f"Total Cost: ${result['total_cost']:.4f}")
+    lines.append(f"Recommendation: {result['final_recommendation']}")
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    if save:
+        # Save output
+        parts = [f"""Total Time: {result['total_latency']:.2f}s
 Total Cost: ${result['total_cost']:.4f}
 Recommendation: {result['final_recommendation']}
 
@@ -414,44 +487,36 @@ Recommendation: {result['final_recommendation']}
 
 ## Stage 1: Context Acquisition (Parallel)
 Models: kimi-researcher + perplexity-online
-"""
-    stage1 = result["stages"].get("context")
-    if stage1:
-        output_content += f"Time: {stage1.total_latency:.2f}s | Cost: ${stage1.total_cost:.4f}\n"
-        output_content += f"Success: {stage1.success_count}/{len(stage1.responses)}\n\n"
-        for response in stage1.get_successful_responses():
-            output_content += f"\n### {response.model}\n{response.content}\n"
-
-    output_content += "\n---\n\n## Stage 2: Deliberation (Parallel)\nModels: deepseek-v3 + gemini-flash + claude-sonnet\n"
-    stage2 = result["stages"].get("deliberation")
-    if stage2:
-        output_content += f"Time: {stage2.total_latency:.2f}s | Cost: ${stage2.total_cost:.4f}\n"
-        output_content += f"Success: {stage2.success_count}/{len(stage2.responses)}\n\n"
-        for response in stage2.get_successful_responses():
-            output_content += f"\n### {response.model}\n{response.content}\n"
-
-    output_content += "\n---\n\n## Stage 3: Semi-Final Synthesis (gemini-pro)\n"
-    stage3 = result["stages"].get("synthesis")
-    if stage3:
-        synthesis = stage3.get_model_content("gemini-pro")
-        output_content += f"Time: {stage3.total_latency:.2f}s | Cost: ${stage3.total_cost:.4f}\n\n"
-        if synthesis:
-            output_content += f"{synthesis}\n"
-
-    output_content += "\n---\n\n## Stage 4: Final Ratification (opus-synthesis)\n"
-    stage4 = result["stages"].get("ratification")
-    if stage4:
-        decree = stage4.get_model_content("opus-synthesis")
-        output_content += f"Time: {stage4.total_latency:.2f}s | Cost: ${stage4.total_cost:.4f}\n\n"
-        if decree:
-            output_content += f"## FINAL COUNCIL DECREE\n\n{decree}\n"
-
-    save_council_output("diamond-debate", output_content, topic[:40])
+"""]
+        if stage1:
+            parts.append(f"Time: {stage1.total_latency:.2f}s | Cost: ${stage1.total_cost:.4f}\n")
+            parts.append(f"Success: {stage1.success_count}/{len(stage1.responses)}\n\n")
+            parts.extend([f"\n### {r.model}\n{r.content}\n" for r in s1_resps])
+
+        parts.append("\n---\n\n## Stage 2: Deliberation (Parallel)\nModels: deepseek-v3 + gemini-flash + claude-sonnet\n")
+        if stage2:
+            parts.append(f"Time: {stage2.total_latency:.2f}s | Cost: ${stage2.total_cost:.4f}\n")
+            parts.append(f"Success: {stage2.success_count}/{len(stage2.responses)}\n\n")
+            parts.extend([f"\n### {r.model}\n{r.content}\n" for r in s2_resps])
+
+        parts.append("\n---\n\n## Stage 3: Semi-Final Synthesis (gemini-pro)\n")
+        if stage3:
+            parts.append(f"Time: {stage3.total_latency:.2f}s | Cost: ${stage3.total_cost:.4f}\n\n")
+            if synthesis:
+                parts.append(f"{synthesis}\n")
+
+        parts.append("\n---\n\n## Stage 4: Final Ratification (opus-synthesis)\n")
+        if stage4:
+            parts.append(f"Time: {stage4.total_latency:.2f}s | Cost: ${stage4.total_cost:.4f}\n\n")
+            if decree:
+                parts.append(f"## FINAL COUNCIL DECREE\n\n{decree}\n")
+
+        save_council_output("diamond-debate", "".join(parts), topic[:40])
 
     return 0
 
 
-def mode_team_debate(topic: str, focus: str = "", context: str = ""):
+def mode_team_debate(topic: str, focus: str = "", context: str = "", save: bool = True):
     """
     Run Team Debate mode using sequential 4-step workflow.
 
@@ -464,102 +529,110 @@ def mode_team_debate(topic: str, focus: str = "", context: str = ""):
     This is the same workflow as team-debate-4step.ps1, providing sequential
     refinement where each step builds on the previous output.
     """
-    from datetime import datetime
-    from paths import get_build_plans_dir, sanitize_filename, ensure_directories
-
     print_banner("team-debate")
     print(f"Topic: {topic[:100]}...")
     if focus:
         print(f"Focus: {focus}")
     print()
 
-    orchestrator = DiamondOrchestrator()
+    try:
+        from parallel_executor import DiamondOrchestrator
+    except ImportError as e:
+        print(f"Error importing Council modules: {e}", file=sys.stderr)
+        return 1
 
     # Execute sequential 4-step debate
-    result = orchestrator.execute_diamond_debate(
-        topic=topic,
-        focus=focus if focus else None,
-        context=context
-    )
-
-    # Ensure build plans directory exists
-    ensure_directories()
+    with DiamondOrchestrator() as orchestrator:
+        result = orchestrator.execute_diamond_debate(
+            topic=topic,
+            focus=focus if focus else None,
+            context=context
+        )
 
     # Display results in format matching PowerShell script
-    print(f"\n{'='*60}")
-    print("TEAM DEBATE RESULTS")
-    print(f"{'='*60}\n")
+    lines = []
+    lines.append(f"\n{_EQ60}")
+    lines.append("TEAM DEBATE RESULTS")
+    lines.append(f"{_EQ60}\n")
 
     # Step 1: Architect
-    print("1️⃣  Step 1: Architect (gemini-architect)")
-    print(f"   Time: {result.step1_architect.latency_seconds:.2f}s | Cost: ${result.step1_architect.cost:.4f}")
+    lines.append("1️⃣  Step 1: Architect (gemini-architect)")
+    lines.append(f"   Time: {result.step1_architect.latency_seconds:.2f}s | Cost: ${result.step1_architect.cost:.4f}")
     if result.step1_architect.success:
         preview = result.step1_architect.content[:300].replace('\n', ' ')
-        print(f"\n   {preview}...")
+        lines.append(f"\n   {preview}...")
     else:
-        print(f"\n   ✗ Error: {result.step1_architect.error}")
+        lines.append(f"\n   ✗ Error: {result.step1_architect.error}")
 
     # Step 2: Auditor
-    print(f"\n2️⃣  Step 2: Auditor (deepseek-v3)")
-    print(f"   Time: {result.step2_auditor.latency_seconds:.2f}s | Cost: ${result.step2_auditor.cost:.4f}")
+    lines.append(f"\n2️⃣  Step 2: Auditor (deepseek-v3)")
+    lines.append(f"   Time: {result.step2_auditor.latency_seconds:.2f}s | Cost: ${result.step2_auditor.cost:.4f}")
     if result.step2_auditor.success:
         preview = result.step2_auditor.content[:300].replace('\n', ' ')
-        print(f"\n   {preview}...")
+        lines.append(f"\n   {preview}...")
     else:
-        print(f"\n   ✗ Error: {result.step2_auditor.error}")
+        lines.append(f"\n   ✗ Error: {result.step2_auditor.error}")
 
     # Step 3: Contextualist
-    print(f"\n3️⃣  Step 3: Contextualist (kimi-researcher)")
-    print(f"   Time: {result.step3_contextualist.latency_seconds:.2f}s | Cost: ${result.step3_contextualist.cost:.4f}")
+    lines.append(f"\n3️⃣  Step 3: Contextualist (kimi-researcher)")
+    lines.append(f"   Time: {result.step3_contextualist.latency_seconds:.2f}s | Cost: ${result.step3_contextualist.cost:.4f}")
     if result.step3_contextualist.success:
         preview = result.step3_contextualist.content[:300].replace('\n', ' ')
-        print(f"\n   {preview}...")
+        lines.append(f"\n   {preview}...")
     else:
-        print(f"\n   ✗ Error: {result.step3_contextualist.error}")
+        lines.append(f"\n   ✗ Error: {result.step3_contextualist.error}")
 
     # Step 4: Judge
-    print(f"\n4️⃣  Step 4: Judge (opus-synthesis)")
-    print(f"   Time: {result.step4_judge.latency_seconds:.2f}s | Cost: ${result.step4_judge.cost:.4f}")
+    lines.append(f"\n4️⃣  Step 4: Judge (opus-synthesis)")
+    lines.append(f"   Time: {result.step4_judge.latency_seconds:.2f}s | Cost: ${result.step4_judge.cost:.4f}")
     if result.step4_judge.success:
-        print(f"\n{'─'*60}")
-        print("🏛️  FINAL COUNCIL DECREE")
-        print(f"{'─'*60}")
-        print(result.step4_judge.content)
+        lines.append(f"\n{_DASH60}")
+        lines.append("🏛️  FINAL COUNCIL DECREE")
+        lines.append(_DASH60)
+        lines.append(result.step4_judge.content)
     else:
-        print(f"\n   ✗ Error: {result.step4_judge.error}")
+        lines.append(f"\n   ✗ Error: {result.step4_judge.error}")
 
     # Summary
-    print(f"\n{'='*60}")
-    print("SUMMARY")
-    print(f"{'='*60}")
-    print(result.format_summary())
-
-    # Save to file
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    slug = sanitize_filename(topic.lower().replace(" ", "-")[:40])
-    focus_suffix = f"-{focus}" if focus else ""
-    filename = f"{timestamp}{focus_suffix}-{slug}.md"
-    artifact_path = get_build_plans_dir() / filename
+    lines.append(f"\n{_EQ60}")
+    lines.append("SUMMARY")
+    lines.append(_EQ60)
+    lines.append(result.format_summary())
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    # Format as markdown
-    markdown = format_team_debate_markdown(topic, focus, context, result)
+    if save:
+        # Save to file
+        from paths import get_build_plans_dir_str, sanitize_filename, ensure_directories
 
-    try:
-        artifact_path.write_text(markdown, encoding="utf-8")
-        print(f"\n✓ Council decree saved to: {artifact_path.name}")
-    except Exception as e:
-        print(f"\n⚠ Warning: Could not save artifact: {e}", file=sys.stderr)
+        ensure_directories()
+        now = datetime.now()
+        timestamp = _file_timestamp(now)
+        slug = sanitize_filename(topic.lower().replace(" ", "-")[:40])
+        focus_suffix = f"-{focus}" if focus else ""
+        filename = f"{timestamp}{focus_suffix}-{slug}.md"
+        artifact_path = os.path.join(get_build_plans_dir_str(), filename)
+
+        try:
+            write_team_debate_markdown(artifact_path, topic, focus, context, result, now)
+            print(f"\n✓ Council decree saved to: {filename}")
+        except Exception as e:
+            print(f"\n⚠ Warning: Could not save artifact: {e}", file=sys.stderr)
 
     return 0
 
 
-def format_team_debate_markdown(topic: str, focus: str, context: str, result) -> str:
-    """Format team debate results as markdown artifact."""
-    from datetime import datetime
+def _team_debate_sections(topic: str, focus: str, result, now: datetime):
+    """Yield the team debate markdown artifact piece by piece."""
+    steps = (
+        ("Step 1: Architect (gemini-architect)", result.step1_architect),
+        ("Step 2: Auditor (deepseek-v3)", result.step2_auditor),
+        ("Step 3: Contextualist (kimi-researcher)", result.step3_contextualist),
+        ("Step 4: Judge (opus-synthesis)", result.step4_judge),
+    )
 
-    md = f"""# Council Review: {topic}
+    yield f"""# Council Review: {topic}
 
-**Generated:** {datetime.now().isoformat()}
+**Generated:** {now.isoformat()}
 **Mode:** Team Debate (Sequential 4-Step)
 **Focus:** {focus if focus else "None"}
 **Total Time:** {result.total_latency:.2f}s
@@ -570,96 +643,111 @@ def format_team_debate_markdown(topic: str, focus: str, context: str, result) ->
 
 ## 🏛️ FINAL COUNCIL DECREE
 
-{result.step4_judge.content if result.step4_judge.success else "Error: " + result.step4_judge.error}
+"""
+    yield result.step4_judge.content if result.step4_judge.success else "Error: " + result.step4_judge.error
+    yield """
 
 ---
 
 ## Full Debate Transcripts
+"""
+    for title, step in steps:
+        yield f"""
+### {title}
+**Time:** {step.latency_seconds:.2f}s | **Cost:** ${step.cost:.4f} | **Tokens:** {step.tokens_used}
 
-### Step 1: Architect (gemini-architect)
-**Time:** {result.step1_architect.latency_seconds:.2f}s | **Cost:** ${result.step1_architect.cost:.4f} | **Tokens:** {result.step1_architect.tokens_used}
-
-{result.step1_architect.content if result.step1_architect.success else "Error: " + result.step1_architect.error}
-
----
-
-### Step 2: Auditor (deepseek-v3)
-**Time:** {result.step2_auditor.latency_seconds:.2f}s | **Cost:** ${result.step2_auditor.cost:.4f} | **Tokens:** {result.step2_auditor.tokens_used}
-
-{result.step2_auditor.content if result.step2_auditor.success else "Error: " + result.step2_auditor.error}
+"""
+        yield step.content if step.success else "Error: " + step.error
+        yield """
 
 ---
+"""
+    yield """
+*Generated by Council Team Debate Mode*
+*Architecture v2.1 - Multi-Tiered AI Collaboration System*
+"""
 
-### Step 3: Contextualist (kimi-researcher)
-**Time:** {result.step3_contextualist.latency_seconds:.2f}s | **Cost:** ${result.step3_contextualist.cost:.4f} | **Tokens:** {result.step3_contextualist.tokens_used}
-
-{result.step3_contextualist.content if result.step3_contextualist.success else "Error: " + result.step3_contextualist.error}
-
----
 
-### Step 4: Judge (opus-synthesis)
-**Time:** {result.step4_judge.latency_seconds:.2f}s | **Cost:** ${result.step4_judge.cost:.4f} | **Tokens:** {result.step4_judge.tokens_used}
+def format_team_debate_markdown(topic: str, focus: str, context: str, result, now: datetime = None) -> str:
+    """Format team debate results as markdown artifact."""
+    return "".join(_team_debate_sections(topic, focus, result, now or datetime.now()))
 
-{result.step4_judge.content if result.step4_judge.success else "Error: " + result.step4_judge.error}
 
----
+def write_team_debate_markdown(path: str, topic: str, focus: str, context: str, result, now: datetime = None):
+    """
+    Write team debate results as a markdown artifact.
 
-*Generated by Council Team Debate Mode*
-*Architecture v2.1 - Multi-Tiered AI Collaboration System*
-"""
-    return md
+    Sections are encoded and streamed through the file buffer as they are
+    produced, so the full document is never held in memory twice.
+    """
+    now = now or datetime.now()
+    with open(path, "wb", buffering=65536) as f:
+        for section in _team_debate_sections(topic, focus, result, now):
+            f.write(section.encode("utf-8"))
+
+
+# Mode routing
+MODES = {
+    "brainstorm": mode_brainstorm,
+    "refine": mode_refine,
+    "build-plan": mode_build_plan,
+    "build-review": mode_build_review,
+    "opus-gatekeeper": mode_opus_gatekeeper,
+    "diamond-debate": mode_diamond_debate,
+    "team-debate": mode_team_debate
+}
+
+
+def _print_usage():
+    """Print command-line usage."""
+    print("Council Multi-Tiered AI Collaboration System")
+    print("\nUsage:")
+    print("  python skill.py brainstorm <prompt>")
+    print("  python skill.py refine <input>")
+    print("  python skill.py build-plan <topic>")
+    print("  python skill.py build-review <summary>")
+    print("  python skill.py opus-gatekeeper <query>")
+    print("  python skill.py diamond-debate <topic>")
+    print("  python skill.py team-debate <topic>")
+    print("\nOptions:")
+    print("  --no-save    Don't save the output to build-plans/")
+    print("\nExamples:")
+    print("  python skill.py brainstorm Ways to improve API performance")
+    print("  python skill.py refine Create a web scraper with caching")
+    print("  python skill.py build-plan Build a Markdown caching system")
+    print("  python skill.py build-review Created scraper with UTF-8 support")
+    print("  python skill.py opus-gatekeeper Design a new auth system")
+    print("  python skill.py diamond-debate Should we use PostgreSQL or MongoDB?")
+    print("  python skill.py team-debate Design a new authentication system")
 
 
 def main():
     """Main entry point for Council skill."""
-    if len(sys.argv) < 3:
-        print("Council Multi-Tiered AI Collaboration System")
-        print("\nUsage:")
-        print("  python skill.py brainstorm <prompt>")
-        print("  python skill.py refine <input>")
-        print("  python skill.py build-plan <topic>")
-        print("  python skill.py build-review <summary>")
-        print("  python skill.py opus-gatekeeper <query>")
-        print("  python skill.py diamond-debate <topic>")
-        print("  python skill.py team-debate <topic>")
-        print("\nExamples:")
-        print("  python skill.py brainstorm Ways to improve API performance")
-        print("  python skill.py refine Create a web scraper with caching")
-        print("  python skill.py build-plan Build a Markdown caching system")
-        print("  python skill.py build-review Created scraper with UTF-8 support")
-        print("  python skill.py opus-gatekeeper Design a new auth system")
-        print("  python skill.py diamond-debate Should we use PostgreSQL or MongoDB?")
-        print("  python skill.py team-debate Design a new authentication system")
+    args = sys.argv[1:]
+    save = "--no-save" not in args
+    if not save:
+        args = [a for a in args if a != "--no-save"]
+
+    if len(args) < 2:
+        _print_usage()
         sys.exit(1)
 
-    mode = sys.argv[1].lower()
-    prompt = " ".join(sys.argv[2:])
-
-    # Mode routing
-    modes = {
-        "brainstorm": mode_brainstorm,
-        "refine": mode_refine,
-        "build-plan": mode_build_plan,
-        "build-review": mode_build_review,
-        "opus-gatekeeper": mode_opus_gatekeeper,
-        "diamond-debate": mode_diamond_debate,
-        "team-debate": mode_team_debate
-    }
-
-    handler = modes.get(mode)
+    mode = args[0].lower()
+    prompt = " ".join(args[1:])
+
+    handler = MODES.get(mode)
     if not handler:
         print(f"Error: Unknown mode '{mode}'", file=sys.stderr)
-        print(f"Available modes: {', '.join(modes.keys())}", file=sys.stderr)
+        print(f"Available modes: {', '.join(MODES)}", file=sys.stderr)
         sys.exit(1)
 
     # Execute mode
-    sys.exit(handler(prompt))
+    sys.exit(handler(prompt, save=save))
 
 
 if __name__ == "__main__":
     # UTF-8 output for Windows
     if sys.platform == "win32":
-        import io
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
 
     main()